@@ -5,6 +5,8 @@ python3 -m venv .venv
 source .venv/bin/activate
 pip install -U pip
 pip install -e ".[dev]"
+# Editable installs don't byte-compile; warm __pycache__ so the first CLI run is fast.
+python -m compileall -q src/clawdbot_internship_automation
 python -m playwright install chromium
 
 if [[ ! -f config/application.yaml ]]; then
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from functools import lru_cache
+from typing import Any, Iterable, TextIO
+
+from .jsonio import dumps, loads
+from .services import Services, get_services, job_from_mapping
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Answer questions and/or build resumes for many jobs in one process. "
+            "Reads one JSON job per line on stdin and writes one JSON result per line."
+        )
+    )
+    parser.add_argument("--config", default="config/application.yaml")
+    parser.add_argument(
+        "--resumes",
+        action="store_true",
+        help="Build a tailored resume for every job.",
+    )
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
+
+
+def process_record(
+    record: dict[str, Any], services: Services, build_resume: bool
+) -> dict[str, Any]:
+    job = job_from_mapping(record)
+    result: dict[str, Any] = {"job_id": job.job_id, "title": job.title, "company": job.company}
+
+    answers = []
+    for question in record.get("questions") or []:
+        prompt = str(question.get("prompt", ""))
+        input_type = str(question.get("input_type", "text"))
+        choices = [str(c) for c in question.get("choices") or []]
+        answers.append(
+            {
+                "prompt": prompt,
+                "input_type": input_type,
+                "choices": choices,
+                "answer": services.question_answerer.answer(
+                    prompt=prompt,
+                    input_type=input_type,
+                    job=job,
+                    choices=choices,
+                ),
+            }
+        )
+    if answers:
+        result["answers"] = answers
+
+    if build_resume:
+        resume_pdf = services.resume_builder.build(
+            job=job,
+            defaults=services.question_answerer.defaults,
+            base_resume_text=services.base_resume_text,
+        )
+        result["resume_pdf"] = str(resume_pdf)
+        result["resume_markdown"] = str(resume_pdf.with_suffix(".md"))
+    return result
+
+
+def run(lines: Iterable[str], out: TextIO, services: Services, build_resume: bool) -> int:
+    failures = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+            if "job_id" not in record or "title" not in record:
+                raise ValueError("each job needs job_id and title")
+            payload = process_record(record, services, build_resume)
+        except Exception as exc:
+            failures += 1
+            payload = {"error": str(exc), "line": line.strip()[:200]}
+        out.write(dumps(payload) + "\n")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    services = get_services(args.config)
+    failures = run(sys.stdin, sys.stdout, services, build_resume=args.resumes)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,25 +2,16 @@ from __future__ import annotations
 
 import argparse
 import logging
-from pathlib import Path
+import sys
+from collections import Counter
+from functools import lru_cache
 
-from .handshake_bot import HandshakeBot
-from .llm import LLMClient
-from .question_answerer import QuestionAnswerer
-from .resume_builder import ResumeBuilder
+from .resume_text import read_base_resume_text
 from .settings import load_config
 
 
-def _read_base_resume_text(path: str) -> str:
-    file_path = Path(path)
-    if not file_path.exists():
-        return ""
-    if file_path.suffix.lower() in {".txt", ".md"}:
-        return file_path.read_text()
-    return ""
-
-
-def parse_args() -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Automate Handshake SWE internship discovery and applications."
     )
@@ -51,15 +42,50 @@ def parse_args() -> argparse.Namespace:
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Log verbosity.",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
+
+
+def _install_fast_event_loop() -> None:
+    # Playwright's sync API runs its own asyncio loop under the hood; with uvloop
+    # installed as the policy, that loop (and any LLM I/O) runs on libuv.
+    # Playwright creates that loop itself, so there is no loop_factory to pass,
+    # and event loop policies are deprecated from Python 3.14: keep the stdlib
+    # loop there rather than rely on a deprecated API.
+    if sys.version_info >= (3, 14):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
     args = parse_args()
+
+    # The format string never prints thread/process fields, so don't collect them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Deferred so --help and argument errors don't pay for Playwright,
+    # reportlab and the OpenAI SDK.
+    from .handshake_bot import HandshakeBot
+    from .llm import LLMClient
+    from .question_answerer import QuestionAnswerer
+    from .resume_builder import ResumeBuilder
+
     logging.basicConfig(
         level=getattr(logging, args.log_level),
         format="%(asctime)s | %(levelname)s | %(message)s",
     )
+    _install_fast_event_loop()
 
     config = load_config(args.config)
     if args.dry_run:
@@ -73,7 +99,7 @@ def main() -> None:
     llm_client = LLMClient(config.llm)
     question_answerer = QuestionAnswerer(config.qa, llm_client)
     resume_builder = ResumeBuilder(config.resume, config.qa, llm_client)
-    base_resume_text = _read_base_resume_text(config.resume.base_resume_path)
+    base_resume_text = read_base_resume_text(config.resume.base_resume_path)
 
     bot = HandshakeBot(
         config=config,
@@ -89,12 +115,11 @@ def main() -> None:
             "If your school uses SSO/Duo, keep the browser window open and complete authentication."
         )
         raise SystemExit(1) from exc
+    finally:
+        llm_client.close()
 
-    status_counts: dict[str, int] = {}
-    for result in results:
-        status_counts[result.status] = status_counts.get(result.status, 0) + 1
-
-    logging.info("Run complete. Results: %s", status_counts)
+    status_counts = Counter(result.status for result in results)
+    logging.info("Run complete. Results: %s", dict(status_counts))
 
 
 if __name__ == "__main__":
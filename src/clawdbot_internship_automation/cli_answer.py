@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from . import daemon_client
+from .jsonio import loads, write_json
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+_REQUIRED_OPTIONS = ("--prompt",)
+_OPTION_DEFAULTS = {
+    "--config": "config/application.yaml",
+    "--input-type": "text",
+    "--choices": "",
+    "--job-id": "runtime-job",
+    "--title": "Software Engineer Intern",
+    "--company": "",
+    "--location": "",
+    "--description": "",
+}
+_FLAG_OPTIONS = ("--json", "--no-daemon")
+
+
+def _dest(option: str) -> str:
+    return option.lstrip("-").replace("-", "_")
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Answer one application question using qa defaults + optional LLM."
+    )
+    for option in _REQUIRED_OPTIONS:
+        parser.add_argument(option, required=True)
+    for option, default in _OPTION_DEFAULTS.items():
+        parser.add_argument(option, default=default)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Always answer in-process, even if clawdbot-daemon is running.",
+    )
+    return parser
+
+
+def _fast_parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse well-formed argv without argparse; None means "let argparse decide"."""
+    values: dict[str, object] = {_dest(o): d for o, d in _OPTION_DEFAULTS.items()}
+    values.update({_dest(o): False for o in _FLAG_OPTIONS})
+    tokens = iter(argv)
+    for token in tokens:
+        option, has_inline, inline = token.partition("=")
+        if option in _FLAG_OPTIONS and not has_inline:
+            values[_dest(option)] = True
+            continue
+        if option not in _OPTION_DEFAULTS and option not in _REQUIRED_OPTIONS:
+            return None
+        if has_inline:
+            values[_dest(option)] = inline
+            continue
+        value = next(tokens, None)
+        if value is None or value.startswith("-"):
+            return None
+        values[_dest(option)] = value
+
+    if any(_dest(o) not in values for o in _REQUIRED_OPTIONS):
+        return None
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv: list[str] | None = None) -> SimpleNamespace:
+    # argparse is only imported for --help, errors and unusual spellings such
+    # as abbreviated options; the common invocation is parsed directly.
+    argv = sys.argv[1:] if argv is None else argv
+    fast = _fast_parse(argv)
+    if fast is not None:
+        return fast
+    return SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+
+
+def _parse_choices(raw: str) -> list[str]:
+    text = (raw or "").strip()
+    if not text:
+        return []
+
+    if text.startswith("["):
+        if msgspec is not None:
+            try:
+                items = msgspec.json.decode(text, type=list[str])
+                return [s for s in (item.strip() for item in items) if s]
+            except msgspec.DecodeError:
+                # Malformed JSON or non-string items: use the generic path below.
+                pass
+        try:
+            parsed = loads(text)
+            if isinstance(parsed, list):
+                return [s for s in (str(item).strip() for item in parsed) if s]
+        except Exception:
+            pass
+
+    return [s for s in (part.strip() for part in text.split("|")) if s]
+
+
+def _answer_via_daemon(args: SimpleNamespace, choices: list[str]) -> str | None:
+    if args.no_daemon:
+        return None
+    result = daemon_client.request(
+        {
+            "op": "answer",
+            "config": os.path.abspath(args.config),
+            "prompt": args.prompt,
+            "input_type": args.input_type,
+            "choices": choices,
+            "job": {
+                "job_id": args.job_id,
+                "title": args.title,
+                "company": args.company,
+                "location": args.location,
+                "description": args.description,
+            },
+        }
+    )
+    return None if result is None else str(result.get("answer", ""))
+
+
+def main() -> int:
+    args = parse_args()
+    choices = _parse_choices(args.choices)
+
+    try:
+        answer = _answer_via_daemon(args, choices)
+    except daemon_client.DaemonError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    if answer is None:
+        from .services import get_services, job_from_mapping
+
+        services = get_services(args.config)
+        answer = services.question_answerer.answer(
+            prompt=args.prompt,
+            input_type=args.input_type,
+            job=job_from_mapping(vars(args)),
+            choices=choices,
+        )
+
+    payload = {
+        "prompt": args.prompt,
+        "input_type": args.input_type,
+        "choices": choices,
+        "answer": answer,
+    }
+    if args.json:
+        write_json(payload)
+    else:
+        print(answer)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
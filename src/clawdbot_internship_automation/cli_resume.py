@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+
+from . import daemon_client
+from .jsonio import write_json
+from .models import JobPosting
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Generate a tailored resume for one Handshake job using project config."
+    )
+    parser.add_argument("--config", default="config/application.yaml")
+    parser.add_argument("--job-id", required=True)
+    parser.add_argument("--title", required=True)
+    parser.add_argument("--company", default="")
+    parser.add_argument("--location", default="")
+    parser.add_argument("--url", default="")
+    parser.add_argument("--description", default="")
+    parser.add_argument("--description-file", default="")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Always build in-process, even if clawdbot-daemon is running.",
+    )
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
+
+
+def _get_description(args: argparse.Namespace) -> str:
+    if args.description_file:
+        try:
+            return Path(args.description_file).read_text()
+        except FileNotFoundError:
+            pass
+    return args.description
+
+
+def _build_via_daemon(args: argparse.Namespace, job: JobPosting) -> Path | None:
+    if args.no_daemon:
+        return None
+    result = daemon_client.request(
+        {"op": "resume", "config": os.path.abspath(args.config), "job": asdict(job)}
+    )
+    if result is None or not result.get("resume_pdf"):
+        return None
+    return Path(result["resume_pdf"])
+
+
+def main() -> int:
+    args = parse_args()
+
+    from .services import job_from_mapping
+
+    job = job_from_mapping({**vars(args), "description": _get_description(args)})
+    try:
+        resume_pdf = _build_via_daemon(args, job)
+    except daemon_client.DaemonError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    if resume_pdf is None:
+        from .services import get_services
+
+        services = get_services(args.config)
+        resume_pdf = services.resume_builder.build(
+            job=job,
+            defaults=services.question_answerer.defaults,
+            base_resume_text=services.base_resume_text,
+        )
+
+    payload = {
+        "job_id": job.job_id,
+        "title": job.title,
+        "company": job.company,
+        "resume_pdf": str(resume_pdf),
+        "resume_markdown": str(resume_pdf.with_suffix(".md")),
+    }
+
+    if args.json:
+        write_json(payload)
+    else:
+        print(payload["resume_pdf"])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import socketserver
+import stat
+import sys
+from pathlib import Path
+from typing import Any
+
+from .daemon_client import is_private, request, socket_path
+from .jsonio import dumps, loads
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line.strip():
+            return
+        try:
+            result = self.server.dispatch(loads(line.decode()))
+            response: dict[str, Any] = {"ok": True, "result": result}
+        except Exception as exc:
+            LOGGER.warning("Daemon request failed: %s", exc)
+            response = {"ok": False, "error": str(exc)}
+        self.wfile.write(dumps(response).encode() + b"\n")
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Serves requests one at a time against a single long-lived Services."""
+
+    def __init__(self, path: Path):
+        super().__init__(str(path), _Handler)
+        self._services: Any = None
+        self._services_key: tuple[str, int] | None = None
+        self._defaults_mtime: int | None = None
+
+    def _services_for(self, config_path: str) -> Any:
+        from .services import Services
+        from .settings import load_config
+
+        key = (config_path, os.stat(config_path).st_mtime_ns)
+        # The answerer reads qa.defaults_path once, so edits to it need a rebuild too.
+        if key == self._services_key and self._defaults_mtime == _mtime_ns(
+            Path(self._services.config.qa.defaults_path)
+        ):
+            return self._services
+
+        if self._services is not None:
+            self._services.llm.close()
+        config = load_config(config_path)
+        self._defaults_mtime = _mtime_ns(Path(config.qa.defaults_path))
+        self._services = Services(config)
+        self._services_key = key
+        return self._services
+
+    def dispatch(self, message: dict[str, Any]) -> dict[str, Any]:
+        from .services import job_from_mapping
+
+        # Config paths such as qa.defaults_path and resume.output_dir are
+        # relative to the working directory, so only serve matching callers.
+        if message.get("cwd") != os.getcwd():
+            raise ValueError("daemon runs in a different working directory")
+
+        op = message.get("op")
+        if op == "ping":
+            return {}
+
+        services = self._services_for(os.path.abspath(str(message["config"])))
+        job = job_from_mapping(message.get("job") or {})
+        if op == "answer":
+            answer = services.question_answerer.answer(
+                prompt=str(message.get("prompt", "")),
+                input_type=str(message.get("input_type", "text")),
+                job=job,
+                choices=[str(c) for c in message.get("choices") or []],
+            )
+            return {"answer": answer}
+        if op == "resume":
+            resume_pdf = services.resume_builder.build(
+                job=job,
+                defaults=services.question_answerer.defaults,
+                base_resume_text=services.base_resume_text,
+            )
+            return {"resume_pdf": str(resume_pdf)}
+        raise ValueError(f"Unknown op: {op}")
+
+
+def serve(path: Path) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not is_private(path.parent, stat.S_IFDIR):
+        raise RuntimeError(
+            f"{path.parent} must be owned by this user and not group/world-writable"
+        )
+    if path.exists():
+        if request({"op": "ping"}, path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        path.unlink()
+
+    old_umask = os.umask(0o177)
+    try:
+        server = _DaemonServer(path)
+    finally:
+        os.umask(old_umask)
+
+    # Turn SIGTERM into SystemExit so the socket file is cleaned up below.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    LOGGER.info("Listening on %s", path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Keep config, LLM client and answerer loaded so clawdbot-answer and "
+            "clawdbot-resume calls skip start-up work."
+        )
+    )
+    parser.add_argument("--socket", default="", help="Unix socket path to listen on.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+    try:
+        serve(Path(args.socket) if args.socket else socket_path())
+    except RuntimeError as exc:
+        LOGGER.error("%s", exc)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Any
+
+from .jsonio import dumps, loads
+
+SOCKET_ENV = "CLAWDBOT_SOCKET"
+CLIENT_TIMEOUT_SEC = 120.0
+
+
+class DaemonError(RuntimeError):
+    """The daemon took a request but sent no usable reply; it may still act on it."""
+
+
+def socket_path() -> Path:
+    explicit = os.getenv(SOCKET_ENV, "").strip()
+    if explicit:
+        return Path(explicit)
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR", "").strip()
+    if runtime_dir:
+        return Path(runtime_dir) / "clawdbot.sock"
+    import tempfile
+
+    # A per-user directory rather than a socket directly in the shared temp dir,
+    # so is_private can require that the parent belongs to us.
+    return Path(tempfile.gettempdir()) / f"clawdbot-{os.getuid()}" / "clawdbot.sock"
+
+
+def is_private(path: Path, file_type: int) -> bool:
+    """True if ``path`` is of ``file_type``, owned by us and not writable by others."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_IFMT(info.st_mode) == file_type
+        and info.st_uid == os.getuid()
+        and not info.st_mode & 0o022
+    )
+
+
+def request(payload: dict[str, Any], path: Path | None = None) -> dict[str, Any] | None:
+    """Send one request to a running daemon.
+
+    Returns the daemon's result, or None when no daemon is reachable or it
+    reported that it could not serve the request, so callers can fall back to
+    running inline. Once the request is sent, a timeout or dropped connection
+    raises DaemonError instead: the daemon may still be generating, and doing
+    the work inline as well would repeat the LLM call and the resume write.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    target = path or socket_path()
+    # Another local user could have bound the path first and would then see
+    # prompts and job data and could forge answers, so only talk to our own.
+    if not is_private(target.parent, stat.S_IFDIR) or not is_private(target, stat.S_IFSOCK):
+        return None
+
+    message = dumps({**payload, "cwd": os.getcwd()}).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CLIENT_TIMEOUT_SEC)
+        try:
+            sock.connect(str(target))
+        except OSError:
+            # Stale socket file or no listener: nothing was sent.
+            return None
+        try:
+            with sock.makefile("rwb") as stream:
+                stream.write(message)
+                stream.flush()
+                line = stream.readline()
+            response = loads(line.decode())
+        except (OSError, ValueError) as exc:
+            raise DaemonError(f"no reply from clawdbot-daemon on {target}: {exc}") from exc
+
+    if not isinstance(response, dict) or not response.get("ok"):
+        return None
+    return response.get("result")
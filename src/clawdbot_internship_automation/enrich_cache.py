@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from .jsonio import dumps, loads
+from .models import JobPosting
+
+LOGGER = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+
+class EnrichCache:
+    """On-disk cache of enriched postings keyed by URL, with a TTL.
+
+    Loaded once per run and written back at the end; safe to share between
+    worker threads. A ttl of 0 disables it.
+    """
+
+    def __init__(self, path: Path, ttl_sec: float):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.enabled:
+            self._entries = self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            raw = loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            LOGGER.warning("Ignoring unreadable enrichment cache %s: %s", self.path, exc)
+            return {}
+        if not isinstance(raw, dict) or raw.get("version") != _CACHE_VERSION:
+            return {}
+        entries = raw.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, url: str) -> JobPosting | None:
+        if not self.enabled or not url:
+            return None
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry or time.time() - float(entry.get("ts", 0)) >= self.ttl_sec:
+            return None
+        try:
+            return JobPosting(**entry["job"])
+        except Exception:
+            return None
+
+    def put(self, job: JobPosting) -> None:
+        if not self.enabled or not job.url:
+            return
+        with self._lock:
+            self._entries[job.url] = {"ts": time.time(), "job": asdict(job)}
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {
+                url: entry
+                for url, entry in self._entries.items()
+                if now - float(entry.get("ts", 0)) < self.ttl_sec
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(dumps({"version": _CACHE_VERSION, "entries": entries}))
+        os.replace(tmp_path, self.path)
@@ -1,30 +1,245 @@
 from __future__ import annotations
 
+import gzip
+import http.cookiejar
 import json
 import logging
+import os
+import queue
 import re
-import time
+import threading
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from urllib.parse import urljoin
+from typing import Callable
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 from playwright.sync_api import (
+    Browser,
     BrowserContext,
     Error as PlaywrightError,
     Locator,
     Page,
     Playwright,
+    Route,
     TimeoutError as PlaywrightTimeoutError,
     sync_playwright,
 )
 
-from .models import ApplicationResult, JobPosting
+from .enrich_cache import EnrichCache
+from .job_filters import JobFilter
+from .job_page_parser import parse_job_page
+from .models import ApplicationQuestion, ApplicationResult, JobPosting
 from .question_answerer import QuestionAnswerer
 from .resume_builder import ResumeBuilder
 from .settings import AutomationConfig
+from .throttle import ApplicationBudget, ApplyPacer
 
 LOGGER = logging.getLogger(__name__)
 
 
+_SUCCESS_STATUSES = frozenset({"applied", "ready_to_submit", "dry_run_ready"})
+
+# Nothing here reads pixels; the viewport stays default because visibility
+# checks depend on real layout.
+_CHROMIUM_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-features=Translate,BackForwardCache",
+    "--mute-audio",
+)
+
+# Stylesheets are kept: visibility checks depend on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_TRACKER_URL_RE = re.compile(
+    r"analytics|gtag|googletagmanager|segment\.(?:io|com)|doubleclick|hotjar|fullstory",
+    re.IGNORECASE,
+)
+
+# Cookies and localStorage from the last successful login, reused across runs.
+_STORAGE_STATE_PATH = Path("artifacts/.handshake_state.json")
+
+_JOB_ANCHOR_SELECTOR = "a[href*='/jobs/'], a[href*='/postings/']"
+_JOB_ID_RE = re.compile(r"/(?:jobs|postings)/(\d+)")
+_JOB_ANCHORS_JS = """
+([selector, limit]) => Array.from(document.querySelectorAll(selector))
+  .slice(0, limit)
+  .map((a) => ({
+    href: a.getAttribute("href") || "",
+    text: (a.innerText || "").split("\\n")[0],
+  }))
+"""
+
+_FIELD_MARKER = "data-clawdbot-field"
+# Mirrors Playwright's is_visible/is_disabled and the label lookup order used
+# for prompts: label[for=id], aria-label, placeholder, name, enclosing
+# label or fieldset legend.
+_FORM_SNAPSHOT_JS = """
+(marker) => {
+  const text = (value) => (value || "").trim();
+  // Radio groups and fieldsets share labels/legends; read each innerText once.
+  const innerTexts = new Map();
+  const innerText = (node) => {
+    if (!node) return "";
+    if (!innerTexts.has(node)) innerTexts.set(node, text(node.innerText));
+    return innerTexts.get(node);
+  };
+  const labelsFor = new Map();
+  for (const label of document.querySelectorAll("label[for]")) {
+    if (!labelsFor.has(label.htmlFor)) labelsFor.set(label.htmlFor, label);
+  }
+  return Array.from(document.querySelectorAll("input, textarea, select")).map((el, idx) => {
+    el.setAttribute(marker, String(idx));
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    const legend = innerText(el.closest("fieldset")?.querySelector("legend"));
+    const prompt = (el.id && innerText(labelsFor.get(el.id)))
+      || text(el.getAttribute("aria-label")) || text(el.getAttribute("placeholder"))
+      || text(el.getAttribute("name")) || innerText(el.closest("label")) || legend
+      || "Application question";
+    const tag = el.tagName.toLowerCase();
+    return {
+      idx,
+      type: tag === "select" ? "select" : text(el.getAttribute("type")).toLowerCase() || "text",
+      name: text(el.getAttribute("name")),
+      value: tag === "select" ? "" : el.value || "",
+      checked: Boolean(el.checked),
+      disabled: el.matches(":disabled"),
+      visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+      prompt,
+      legend,
+      options: tag !== "select" ? [] : Array.from(el.options)
+        .map((opt) => ({ label: (opt.textContent || "").trim(), value: opt.value || "" }))
+        .filter((opt) => opt.label && opt.label.toLowerCase() !== "select"),
+    };
+  });
+}
+"""
+_SETTLE_FLOOR_MS = 150
+# SPA actions (clicks, Enter, uploads) don't navigate, so networkidle says
+# nothing about them; instead watch the DOM and wait until it has changed and
+# then stayed quiet for a moment, i.e. the next step has rendered.
+_DOM_QUIET_MS = 200
+_DOM_WATCH_JS = """
+() => {
+  window.__clawdbotDom?.observer.disconnect();
+  const state = { last: 0 };
+  state.observer = new MutationObserver(() => { state.last = performance.now(); });
+  state.observer.observe(document.documentElement, { childList: true, subtree: true });
+  window.__clawdbotDom = state;
+}
+"""
+# A missing watch state means the action navigated to a new document.
+_DOM_SETTLED_JS = """
+(quietMs) => {
+  const state = window.__clawdbotDom;
+  if (!state) return document.readyState !== "loading";
+  return state.last > 0 && performance.now() - state.last >= quietMs;
+}
+"""
+_ANCHOR_COUNT_GREW_JS = """
+([selector, count]) => document.querySelectorAll(selector).length > count
+"""
+_LOGIN_RESUBMIT_SEC = 5
+# Button names in priority order: an earlier pattern wins over an earlier DOM node,
+# e.g. "Sign in" over a "Continue with Google" button that precedes it.
+_LOGIN_BUTTONS = (
+    re.compile(r"sign in", re.IGNORECASE),
+    re.compile(r"log in", re.IGNORECASE),
+    re.compile(r"continue", re.IGNORECASE),
+    re.compile(r"next", re.IGNORECASE),
+)
+_APPLY_BUTTONS = (
+    re.compile(r"easy apply", re.IGNORECASE),
+    re.compile(r"quick apply", re.IGNORECASE),
+    re.compile(r"apply now", re.IGNORECASE),
+    re.compile(r"^apply$", re.IGNORECASE),
+)
+_SUBMIT_BUTTONS = (
+    re.compile(r"submit", re.IGNORECASE),
+    re.compile(r"send application", re.IGNORECASE),
+    re.compile(r"finish", re.IGNORECASE),
+)
+_NEXT_BUTTONS = (
+    re.compile(r"next", re.IGNORECASE),
+    re.compile(r"continue", re.IGNORECASE),
+    re.compile(r"review", re.IGNORECASE),
+    re.compile(r"save and continue", re.IGNORECASE),
+)
+# Presence checks don't care which tier matched, so they use one query.
+_SUBMIT_BUTTON_RE = re.compile("|".join(p.pattern for p in _SUBMIT_BUTTONS), re.IGNORECASE)
+_APPLY_TEXT_RE = re.compile(r"apply", re.IGNORECASE)
+# A question to answer plus the callback that applies its answer to the page.
+_PendingQuestion = tuple[ApplicationQuestion, Callable[[str], None]]
+_CONSENT_TOKENS = ("agree", "consent", "acknowledge", "certify", "privacy", "terms")
+
+
+class _RefuseRedirects(urllib.request.HTTPRedirectHandler):
+    """Turn redirects into HTTPError instead of following them with our cookies."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class _PagePool:
+    """Recycles pages within one context instead of opening a new one per job."""
+
+    def __init__(self, context: BrowserContext, timeout_ms: int):
+        self.context = context
+        self._timeout_ms = timeout_ms
+        self._idle: list[Page] = []
+
+    def acquire(self) -> Page:
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                return page
+        page = self.context.new_page()
+        page.set_default_timeout(self._timeout_ms)
+        return page
+
+    def release(self, page: Page) -> None:
+        if page.is_closed():
+            return
+        try:
+            page.goto("about:blank")
+        except Exception:
+            try:
+                page.close()
+            except Exception:
+                pass
+            return
+        self._idle.append(page)
+
+
+class _ResultLog:
+    """Thread-safe JSONL sink that writes each result as soon as it is produced.
+
+    Lines are flushed immediately, so a crash mid-run keeps what was recorded.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("w")
+        self._lock = threading.Lock()
+        self.results: list[ApplicationResult] = []
+
+    def add(self, result: ApplicationResult) -> None:
+        line = json.dumps(asdict(result)) + "\n"
+        with self._lock:
+            self.results.append(result)
+            self._file.write(line)
+            self._file.flush()
+
+    def __enter__(self) -> _ResultLog:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._file.close()
+
+
 class HandshakeBot:
     def __init__(
         self,
@@ -37,67 +252,225 @@ class HandshakeBot:
         self.resume_builder = resume_builder
         self.question_answerer = question_answerer
         self.base_resume_text = base_resume_text
+        self._enrich_cache = EnrichCache(
+            Path("artifacts/.enrich_cache.json"),
+            ttl_sec=config.application.enrich_cache_ttl_hours * 3600,
+        )
+        self._job_filter = JobFilter(config.filters)
+        self._resume_executor: ThreadPoolExecutor | None = None
 
     def run(self) -> list[ApplicationResult]:
-        results: list[ApplicationResult] = []
-        applied_or_ready = 0
+        budget = ApplicationBudget(self.config.application.max_applications)
+        # One pacer for every worker, so parallelism doesn't multiply the rate.
+        pacer = ApplyPacer(self.config.application.pause_between_apps_sec)
+        log = _ResultLog(Path("artifacts/application_results.jsonl"))
+        self._resume_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.application.parallel_workers),
+            thread_name_prefix="resume",
+        )
 
-        with sync_playwright() as playwright:
-            browser, context = self._new_browser(playwright)
-            try:
-                page = context.new_page()
-                page.set_default_timeout(self.config.browser.timeout_ms)
-                self._login(page)
+        try:
+            with log, sync_playwright() as playwright:
+                browser, context = self._new_browser(playwright)
+                try:
+                    page = context.new_page()
+                    page.set_default_timeout(self.config.browser.timeout_ms)
+                    self._login(page)
+                    # Only after login: SSO/CAPTCHA pages may need their images.
+                    self._block_heavy_resources(context)
+
+                    jobs = self._discover_jobs(page)
+                    LOGGER.info("Discovered %s candidate postings.", len(jobs))
+
+                    workers = min(max(1, self.config.application.parallel_workers), len(jobs))
+                    if workers > 1:
+                        self._run_parallel(
+                            jobs, context.storage_state(), budget, pacer, workers, log
+                        )
+                    else:
+                        self._run_serial(jobs, context, budget, pacer, log)
+                    if budget.exhausted:
+                        LOGGER.info("Reached max_applications=%s", budget.completed)
+                finally:
+                    browser.close()
+                    self._enrich_cache.save()
+        finally:
+            self._resume_executor.shutdown(wait=True)
+            self._resume_executor = None
 
-                jobs = self._discover_jobs(page)
-                LOGGER.info("Discovered %s candidate postings.", len(jobs))
+        return log.results
 
-                for seed_job in jobs:
-                    if applied_or_ready >= self.config.application.max_applications:
-                        LOGGER.info("Reached max_applications=%s", applied_or_ready)
-                        break
+    def _run_serial(
+        self,
+        jobs: list[JobPosting],
+        context: BrowserContext,
+        budget: ApplicationBudget,
+        pacer: ApplyPacer,
+        log: _ResultLog,
+    ) -> None:
+        pages = _PagePool(context, self.config.browser.timeout_ms)
+        opener = self._prefetch_opener(context.cookies())
+        # Fetch the next posting off-thread while this one is filled in. Playwright
+        # objects are bound to this thread, so the prefetch uses plain urllib.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            upcoming: Future[JobPosting | None] | None = None
+            for index, seed_job in enumerate(jobs):
+                if budget.exhausted:
+                    break
+                prefetched = upcoming.result() if upcoming is not None else None
+                upcoming = None
+                if index + 1 < len(jobs) and self._enrich_cache.get(jobs[index + 1].url) is None:
+                    upcoming = prefetcher.submit(self._prefetch_job, jobs[index + 1], opener)
+                result = self._process_job(seed_job, pages, budget, pacer, prefetched)
+                if result is not None:
+                    log.add(result)
+
+    def _run_parallel(
+        self,
+        jobs: list[JobPosting],
+        storage_state: dict,
+        budget: ApplicationBudget,
+        pacer: ApplyPacer,
+        workers: int,
+        log: _ResultLog,
+    ) -> None:
+        # Playwright's sync API is bound to the thread that started it, so each
+        # worker drives its own browser, seeded with the logged-in session.
+        job_queue: queue.SimpleQueue[JobPosting] = queue.SimpleQueue()
+        for job in jobs:
+            job_queue.put(job)
+
+        def worker() -> None:
+            with sync_playwright() as playwright:
+                browser = self._launch_browser(playwright)
+                try:
+                    context = self._new_context(browser, storage_state)
+                    self._block_heavy_resources(context)
+                    pages = _PagePool(context, self.config.browser.timeout_ms)
+                    while not budget.exhausted:
+                        try:
+                            seed_job = job_queue.get_nowait()
+                        except queue.Empty:
+                            return
+                        result = self._process_job(seed_job, pages, budget, pacer)
+                        if result is not None:
+                            log.add(result)
+                finally:
+                    browser.close()
+
+        LOGGER.info("Processing jobs with %s parallel workers.", workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as exc:
+                    LOGGER.warning("Worker stopped early: %s", exc)
 
-                    job = self._enrich_job(seed_job, context)
-                    if not self._matches_filters(job):
-                        results.append(
-                            ApplicationResult(
-                                job_id=job.job_id,
-                                title=job.title,
-                                company=job.company,
-                                url=job.url,
-                                status="skipped",
-                                reason="filter_mismatch",
-                            )
-                        )
-                        continue
+    def _process_job(
+        self,
+        seed_job: JobPosting,
+        pages: _PagePool,
+        budget: ApplicationBudget,
+        pacer: ApplyPacer,
+        prefetched: JobPosting | None = None,
+    ) -> ApplicationResult | None:
+        job = self._enrich_job(seed_job, pages, prefetched)
+        if not self._job_filter.matches(job):
+            return ApplicationResult(
+                job_id=job.job_id,
+                title=job.title,
+                company=job.company,
+                url=job.url,
+                status="skipped",
+                reason="filter_mismatch",
+            )
 
-                    result = self._apply_to_job(job, context)
-                    results.append(result)
+        if not budget.try_reserve():
+            return None
+        succeeded = False
+        try:
+            pacer.wait()
+            result = self._apply_to_job(job, pages)
+            succeeded = result.status in _SUCCESS_STATUSES
+        finally:
+            budget.release(succeeded)
 
-                    if result.status in {"applied", "ready_to_submit", "dry_run_ready"}:
-                        applied_or_ready += 1
-                        time.sleep(self.config.application.pause_between_apps_sec)
-            finally:
-                browser.close()
+        if succeeded:
+            pacer.mark_applied()
+        return result
 
-        self._write_results(results)
-        return results
+    def _new_browser(self, playwright: Playwright) -> tuple[Browser, BrowserContext]:
+        browser = self._launch_browser(playwright)
+        return browser, self._new_context(browser, self._load_storage_state())
 
-    def _new_browser(self, playwright: Playwright):
-        browser = playwright.chromium.launch(
+    def _launch_browser(self, playwright: Playwright) -> Browser:
+        return playwright.chromium.launch(
             headless=self.config.browser.headless,
             slow_mo=self.config.browser.slow_mo_ms,
+            args=list(_CHROMIUM_ARGS),
         )
-        context = browser.new_context()
-        return browser, context
+
+    def _new_context(self, browser: Browser, storage_state: dict | None = None) -> BrowserContext:
+        # Service workers fetch outside page.route, so they would bypass blocking.
+        service_workers = "block" if self.config.browser.block_heavy_resources else "allow"
+        return browser.new_context(storage_state=storage_state, service_workers=service_workers)
+
+    def _block_heavy_resources(self, context: BrowserContext) -> None:
+        if not self.config.browser.block_heavy_resources:
+            return
+        context.route("**/*", self._route_request)
+
+    @staticmethod
+    def _route_request(route: Route) -> None:
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _TRACKER_URL_RE.search(
+            request.url
+        ):
+            route.abort()
+        else:
+            route.continue_()
 
     def _login(self, page: Page) -> None:
+        if _STORAGE_STATE_PATH.exists():
+            self._safe_goto(page, self.config.handshake.jobs_url)
+            self._settle(page)
+            if self._is_authenticated_url(self._safe_page_url(page)):
+                LOGGER.info("Reusing saved Handshake session.")
+                return
+
         LOGGER.info("Opening login page.")
         self._safe_goto(page, self.config.handshake.login_url)
         self._attempt_login_submission(page, attempts=3)
         self._wait_for_login_completion(page, timeout_sec=180)
+        self._save_storage_state(page.context)
         self._safe_goto(page, self.config.handshake.jobs_url)
-        self._safe_wait(page, 1500)
+        self._settle(page)
+
+    @staticmethod
+    def _load_storage_state() -> dict | None:
+        try:
+            state = json.loads(_STORAGE_STATE_PATH.read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            LOGGER.warning("Ignoring unreadable session file %s: %s", _STORAGE_STATE_PATH, exc)
+            return None
+        return state if isinstance(state, dict) else None
+
+    @staticmethod
+    def _save_storage_state(context: BrowserContext) -> None:
+        # Holds session cookies, so keep it private to the user.
+        tmp_path = _STORAGE_STATE_PATH.with_name(_STORAGE_STATE_PATH.name + ".tmp")
+        try:
+            state = context.storage_state()
+            _STORAGE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, _STORAGE_STATE_PATH)
+        except Exception as exc:
+            LOGGER.warning("Could not save Handshake session: %s", exc)
 
     def _attempt_login_submission(self, page: Page, attempts: int = 1) -> None:
         email_selectors = [
@@ -111,12 +484,6 @@ class HandshakeBot:
             "input[name='password']",
             "input#password",
         ]
-        button_patterns = [
-            re.compile(r"sign in", re.IGNORECASE),
-            re.compile(r"log in", re.IGNORECASE),
-            re.compile(r"continue", re.IGNORECASE),
-            re.compile(r"next", re.IGNORECASE),
-        ]
 
         for _ in range(max(1, attempts)):
             if page.is_closed():
@@ -130,13 +497,18 @@ class HandshakeBot:
             self._fill_first(page, email_selectors, self.config.handshake.email)
             self._fill_first(page, password_selectors, self.config.handshake.password)
 
-            clicked = self._click_button(page, button_patterns)
+            clicked = self._click_button(page, _LOGIN_BUTTONS)
             if not clicked:
                 clicked = self._click_submit_if_enabled(page)
             if not clicked:
                 self._press_enter_first(page, password_selectors + email_selectors)
 
-            self._safe_wait(page, 900)
+            try:
+                page.wait_for_url(
+                    lambda url: url != current_url, timeout=5000, wait_until="commit"
+                )
+            except PlaywrightTimeoutError:
+                pass
 
     def _wait_for_login_completion(self, page: Page, timeout_sec: int) -> None:
         LOGGER.info(
@@ -144,24 +516,36 @@ class HandshakeBot:
             "Waiting up to %s seconds.",
             timeout_sec,
         )
-        for second in range(timeout_sec):
+        waited = 0
+        while waited < timeout_sec:
             if page.is_closed():
                 raise RuntimeError(
                     "Browser page was closed during login. Keep the window open through SSO/2FA."
                 )
 
-            url = self._safe_page_url(page)
-            if self._is_authenticated_url(url):
+            # Event-driven: returns as soon as the URL turns authenticated.
+            step = min(_LOGIN_RESUBMIT_SEC, timeout_sec - waited)
+            try:
+                page.wait_for_url(
+                    self._is_authenticated_url, timeout=step * 1000, wait_until="commit"
+                )
                 LOGGER.info("Login completed.")
                 return
-
-            if second in {10, 30, 60, 120}:
-                LOGGER.info("Still waiting on login completion at URL: %s", url or "unknown")
-
-            if second % 5 == 0:
-                self._attempt_login_submission(page, attempts=1)
-
-            self._safe_wait(page, 1000)
+            except PlaywrightTimeoutError:
+                waited += step
+            except PlaywrightError as exc:
+                if "closed" in str(exc).lower():
+                    raise RuntimeError(
+                        "Browser page was closed during login. Keep the window open through SSO/2FA."
+                    ) from exc
+                raise
+
+            if waited in {10, 30, 60, 120}:
+                LOGGER.info(
+                    "Still waiting on login completion at URL: %s",
+                    self._safe_page_url(page) or "unknown",
+                )
+            self._attempt_login_submission(page, attempts=1)
 
         raise RuntimeError(
             "Timed out waiting for Handshake login completion. "
@@ -181,36 +565,43 @@ class HandshakeBot:
                 if box.count() > 0:
                     try:
                         box.first.fill(query)
+                        self._watch_dom(page)
                         box.first.press("Enter")
-                        page.wait_for_timeout(1200)
+                        self._wait_for_dom(page)
                         break
                     except Exception:
                         continue
 
         for _ in range(5):
+            count = page.locator(_JOB_ANCHOR_SELECTOR).count()
             page.mouse.wheel(0, 3500)
-            page.wait_for_timeout(600)
+            self._wait_until(page, _ANCHOR_COUNT_GREW_JS, [_JOB_ANCHOR_SELECTOR, count], 1000)
 
-        anchors = page.locator("a[href*='/jobs/'], a[href*='/postings/']")
-        count = min(anchors.count(), self.config.filters.max_discovered_jobs * 4)
-        seen_urls: set[str] = set()
+        limit = self.config.filters.max_discovered_jobs * 4
+        # One round-trip for every anchor instead of two per anchor.
+        anchors = page.evaluate(_JOB_ANCHORS_JS, [_JOB_ANCHOR_SELECTOR, limit])
+        base_url = page.url
+        seen_keys: set[str] = set()
         jobs: list[JobPosting] = []
 
-        for idx in range(count):
-            node = anchors.nth(idx)
-            href = (node.get_attribute("href") or "").strip()
+        for idx, anchor in enumerate(anchors):
+            href = str(anchor.get("href") or "").strip()
             if not href:
                 continue
             if "/jobs/" not in href and "/postings/" not in href:
                 continue
 
-            url = urljoin(page.url, href.split("?")[0])
-            if url in seen_urls:
+            parts = urlsplit(urljoin(base_url, href))
+            match = _JOB_ID_RE.search(parts.path)
+            # Several cards often link the same posting with different query strings.
+            key = match.group(1) if match else parts.path
+            if key in seen_keys:
                 continue
-            seen_urls.add(url)
+            seen_keys.add(key)
 
-            title = (node.inner_text() or "").splitlines()[0].strip()
-            job_id = self._extract_job_id(url, idx)
+            url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+            title = str(anchor.get("text") or "").strip()
+            job_id = match.group(1) if match else f"idx-{idx}"
             jobs.append(JobPosting(job_id=job_id, title=title or "Unknown Role", url=url))
 
             if len(jobs) >= self.config.filters.max_discovered_jobs:
@@ -218,31 +609,34 @@ class HandshakeBot:
 
         return jobs
 
-    def _enrich_job(self, seed: JobPosting, context: BrowserContext) -> JobPosting:
-        page = context.new_page()
-        page.set_default_timeout(self.config.browser.timeout_ms)
+    def _enrich_job(
+        self, seed: JobPosting, pages: _PagePool, prefetched: JobPosting | None = None
+    ) -> JobPosting:
+        job = self._enrich_cache.get(seed.url)
+        if job is not None:
+            return job
+
+        job = prefetched or self._enrich_job_from_html(seed, pages.context)
+        if job is None:
+            job = self._enrich_job_from_page(seed, pages)
+        if job is None:
+            return seed
+        self._enrich_cache.put(job)
+        return job
+
+    def _enrich_job_from_page(self, seed: JobPosting, pages: _PagePool) -> JobPosting | None:
+        page = pages.acquire()
         try:
             page.goto(seed.url, wait_until="domcontentloaded")
-            page.wait_for_timeout(900)
-
-            title = self._first_text(page, ["h1"]) or seed.title
-            company = self._first_text(
-                page,
-                [
-                    "a[href*='/employers/']",
-                    "[data-testid='employer-name']",
-                    "[data-qa='employer-name']",
-                ],
-            )
-            location = self._first_text(
-                page,
-                [
-                    "[data-testid='location']",
-                    "[data-qa='job-location']",
-                    "main span",
-                ],
-            )
-            description = self._first_text(page, ["main", "article", "body"])[:12000]
+            self._settle(page)
+
+            # Parse the rendered DOM in-process instead of one locator query per
+            # selector; only fields the table misses fall back to Playwright.
+            fields = parse_job_page(page.content())
+            title = fields.get("title") or seed.title
+            company = fields.get("company", "")
+            location = fields.get("location") or self._first_text(page, ["main span"])
+            description = (fields.get("description") or self._first_text(page, ["body"]))[:12000]
 
             return JobPosting(
                 job_id=seed.job_id,
@@ -254,38 +648,116 @@ class HandshakeBot:
             )
         except Exception as exc:
             LOGGER.warning("Could not enrich job %s: %s", seed.url, exc)
-            return seed
+            return None
         finally:
-            page.close()
+            pages.release(page)
 
-    def _matches_filters(self, job: JobPosting) -> bool:
-        text = f"{job.title}\n{job.company}\n{job.location}\n{job.description}".lower()
+    def _enrich_job_from_html(
+        self, seed: JobPosting, context: BrowserContext
+    ) -> JobPosting | None:
+        """Fetch the posting over HTTP with the session cookies, without rendering.
 
-        include = [kw.lower() for kw in self.config.filters.include_keywords if kw.strip()]
-        exclude = [kw.lower() for kw in self.config.filters.exclude_keywords if kw.strip()]
-        preferred_locations = [
-            kw.lower() for kw in self.config.filters.preferred_locations if kw.strip()
-        ]
+        Returns None when the server-rendered HTML lacks a title or description
+        (e.g. a client-rendered shell) so the caller falls back to a real page.
+        """
+        try:
+            response = context.request.get(
+                seed.url, timeout=self.config.browser.timeout_ms
+            )
+            if not response.ok:
+                return None
+            if "html" not in response.headers.get("content-type", ""):
+                return None
+            fields = parse_job_page(response.text())
+        except Exception as exc:
+            LOGGER.debug("HTTP enrichment failed for %s: %s", seed.url, exc)
+            return None
+        return self._job_from_page_fields(seed, fields)
 
-        if include and not any(kw in text for kw in include):
-            return False
-        if exclude and any(kw in text for kw in exclude):
-            return False
-        if self.config.filters.remote_only and "remote" not in text:
-            return False
-        if preferred_locations and not any(loc in text for loc in preferred_locations):
-            return False
-        return True
+    @staticmethod
+    def _prefetch_opener(cookies: list[dict]) -> urllib.request.OpenerDirector:
+        """urllib opener carrying the browser session with the browser's cookie rules.
+
+        Domain, path, secure and expiry are enforced by the jar, and redirects are
+        refused so the session is never replayed against another host.
+        """
+        policy = http.cookiejar.DefaultCookiePolicy(
+            strict_ns_domain=http.cookiejar.DefaultCookiePolicy.DomainStrictNonDomain
+        )
+        jar = http.cookiejar.CookieJar(policy)
+        for cookie in cookies:
+            domain = str(cookie.get("domain", ""))
+            expires = float(cookie.get("expires", -1) or -1)
+            if not domain:
+                continue
+            jar.set_cookie(
+                http.cookiejar.Cookie(
+                    version=0,
+                    name=str(cookie["name"]),
+                    value=str(cookie["value"]),
+                    port=None,
+                    port_specified=False,
+                    # A leading dot marks a domain cookie; without it the
+                    # cookie is host-only, which the strict policy enforces.
+                    domain=domain,
+                    domain_specified=domain.startswith("."),
+                    domain_initial_dot=domain.startswith("."),
+                    path=str(cookie.get("path") or "/"),
+                    path_specified=True,
+                    secure=bool(cookie.get("secure")),
+                    expires=int(expires) if expires > 0 else None,
+                    discard=expires <= 0,
+                    comment=None,
+                    comment_url=None,
+                    rest={},
+                )
+            )
+        return urllib.request.build_opener(
+            _RefuseRedirects(), urllib.request.HTTPCookieProcessor(jar)
+        )
+
+    def _prefetch_job(
+        self, seed: JobPosting, opener: urllib.request.OpenerDirector
+    ) -> JobPosting | None:
+        """Like _enrich_job_from_html, but safe to run off the Playwright thread."""
+        parts = urlsplit(seed.url)
+        jobs_host = urlsplit(self.config.handshake.jobs_url).hostname
+        if parts.scheme != "https" or parts.hostname != jobs_host:
+            return None
+        try:
+            with opener.open(seed.url, timeout=self.config.browser.timeout_ms / 1000) as response:
+                if urlsplit(response.geturl()).hostname != parts.hostname:
+                    return None
+                if "html" not in response.headers.get("Content-Type", ""):
+                    return None
+                charset = response.headers.get_content_charset() or "utf-8"
+                fields = parse_job_page(response.read().decode(charset, "replace"))
+        except Exception as exc:
+            LOGGER.debug("Prefetch failed for %s: %s", seed.url, exc)
+            return None
+        return self._job_from_page_fields(seed, fields)
+
+    @staticmethod
+    def _job_from_page_fields(seed: JobPosting, fields: dict[str, str]) -> JobPosting | None:
+        if not fields.get("title") or not fields.get("description"):
+            return None
+        return JobPosting(
+            job_id=seed.job_id,
+            title=fields["title"],
+            company=fields.get("company", ""),
+            location=fields.get("location", ""),
+            description=fields["description"][:12000],
+            url=seed.url,
+        )
 
-    def _apply_to_job(self, job: JobPosting, context: BrowserContext) -> ApplicationResult:
+    def _apply_to_job(self, job: JobPosting, pages: _PagePool) -> ApplicationResult:
         LOGGER.info("Applying to: %s (%s)", job.title, job.url)
-        page = context.new_page()
-        page.set_default_timeout(self.config.browser.timeout_ms)
+        page = pages.acquire()
         uploaded_resume = False
 
         try:
             page.goto(job.url, wait_until="domcontentloaded")
-            page.wait_for_timeout(1000)
+            self._settle(page)
 
             if not self._click_apply(page):
                 return ApplicationResult(
@@ -297,7 +769,10 @@ class HandshakeBot:
                     reason="apply_button_not_found",
                 )
 
-            resume_path = self.resume_builder.build(
+            # Tailoring the resume is an LLM round-trip; let it run while the
+            # form is filled and only wait for it once an upload field appears.
+            resume = self._resume_executor.submit(
+                self.resume_builder.build,
                 job=job,
                 defaults=self.question_answerer.defaults,
                 base_resume_text=self.base_resume_text,
@@ -305,11 +780,13 @@ class HandshakeBot:
 
             for _ in range(14):
                 if not uploaded_resume:
-                    uploaded_resume = self._upload_resume_if_visible(page, resume_path)
+                    uploaded_resume = self._upload_resume_if_visible(page, resume)
 
                 self._fill_visible_fields(page, job)
 
                 if self._has_submit_button(page):
+                    # No upload field may have appeared; a failed build still fails the job.
+                    resume.result()
                     if self.config.application.dry_run or not self.config.application.auto_submit:
                         return ApplicationResult(
                             job_id=job.job_id,
@@ -331,8 +808,6 @@ class HandshakeBot:
                 if not self._click_next_step(page):
                     break
 
-                page.wait_for_timeout(1000)
-
             return ApplicationResult(
                 job_id=job.job_id,
                 title=job.title,
@@ -352,7 +827,7 @@ class HandshakeBot:
                 reason=str(exc),
             )
         finally:
-            page.close()
+            pages.release(page)
 
     def _save_failure_html(self, page: Page, job_id: str) -> None:
         if not self.config.application.save_html_on_failure:
@@ -360,232 +835,215 @@ class HandshakeBot:
         try:
             failure_dir = Path("artifacts/failures")
             failure_dir.mkdir(parents=True, exist_ok=True)
-            html = page.content()
-            failure_path = failure_dir / f"{job_id}.html"
-            failure_path.write_text(html)
+            data = page.content().encode("utf-8")
+            # Level 1 keeps most of the size win at a fraction of the CPU; the
+            # rename means readers never see a half-written capture.
+            tmp_path = failure_dir / f"{job_id}.html.gz.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+                f.write(data)
+            os.replace(tmp_path, failure_dir / f"{job_id}.html.gz")
         except Exception:
             return
 
     def _fill_visible_fields(self, page: Page, job: JobPosting) -> None:
-        self._fill_text_inputs(page, job)
-        self._fill_select_inputs(page, job)
-        self._fill_radio_inputs(page, job)
-        self._fill_checkboxes(page)
-
-    def _fill_text_inputs(self, page: Page, job: JobPosting) -> None:
-        fields = page.locator(
-            "input:not([type='hidden']):not([type='file']):not([type='radio']):not([type='checkbox']), textarea"
-        )
-        count = min(fields.count(), 300)
-        for i in range(count):
-            field = fields.nth(i)
-            if not self._is_visible(field):
-                continue
-            if self._is_disabled(field):
-                continue
-            value = self._input_value(field)
-            if value.strip():
-                continue
+        # Read every field in one round-trip, then only touch the ones to fill.
+        try:
+            fields = page.evaluate(_FORM_SNAPSHOT_JS, _FIELD_MARKER)
+        except Exception as exc:
+            LOGGER.debug("Could not snapshot form fields: %s", exc)
+            return
 
-            input_type = (field.get_attribute("type") or "text").strip().lower()
-            prompt = self._prompt_for_input(page, field)
-            answer = self.question_answerer.answer(
-                prompt=prompt,
-                input_type=input_type,
-                job=job,
-                choices=[],
+        text_fields: list[dict] = []
+        selects: list[dict] = []
+        radio_groups: dict[str, list[dict]] = {}
+        checkboxes: list[dict] = []
+        for field in fields:
+            kind = field["type"]
+            if kind == "select":
+                selects.append(field)
+            elif kind == "radio":
+                if field["name"]:
+                    radio_groups.setdefault(field["name"], []).append(field)
+            elif kind == "checkbox":
+                checkboxes.append(field)
+            elif kind not in ("hidden", "file"):
+                text_fields.append(field)
+
+        # Answer every question on the page in one call, then apply the answers.
+        pending = [
+            *self._text_input_questions(page, text_fields[:300]),
+            *self._select_questions(page, selects[:100]),
+            *self._radio_questions(page, radio_groups),
+        ]
+        if pending:
+            answers = self.question_answerer.answer_batch(
+                [question for question, _ in pending], job
             )
-            if not answer:
-                continue
-            try:
-                field.fill(answer)
-            except Exception:
-                continue
+            for (_, apply_answer), answer in zip(pending, answers):
+                try:
+                    apply_answer(answer)
+                except Exception:
+                    continue
+        self._fill_checkboxes(page, checkboxes[:200])
 
-    def _fill_select_inputs(self, page: Page, job: JobPosting) -> None:
-        selects = page.locator("select")
-        count = min(selects.count(), 100)
-        for i in range(count):
-            field = selects.nth(i)
-            if not self._is_visible(field):
+    def _text_input_questions(self, page: Page, fields: list[dict]) -> list[_PendingQuestion]:
+        pending: list[_PendingQuestion] = []
+        for field in fields:
+            if not field["visible"] or field["disabled"] or field["value"].strip():
                 continue
-            if self._is_disabled(field):
-                continue
-
-            prompt = self._prompt_for_input(page, field)
-            options = self._select_options(field)
-            if not options:
+            question = ApplicationQuestion(prompt=field["prompt"], input_type=field["type"])
+            pending.append((question, partial(self._apply_text_answer, page, field)))
+        return pending
+
+    def _apply_text_answer(self, page: Page, field: dict, answer: str) -> None:
+        if answer:
+            self._field_locator(page, field).fill(answer)
+
+    def _select_questions(self, page: Page, fields: list[dict]) -> list[_PendingQuestion]:
+        pending: list[_PendingQuestion] = []
+        for field in fields:
+            if not field["visible"] or field["disabled"] or not field["options"]:
                 continue
-            labels = [item["label"] for item in options]
-
-            answer = self.question_answerer.answer(
-                prompt=prompt,
+            question = ApplicationQuestion(
+                prompt=field["prompt"],
                 input_type="select",
-                job=job,
-                choices=labels,
+                choices=[item["label"] for item in field["options"]],
             )
-            selected = ""
-            if answer:
-                selected = self._best_choice(answer, labels)
-
-            if not selected:
-                selected = labels[0]
-
-            value = ""
-            for opt in options:
-                if opt["label"] == selected:
-                    value = opt["value"]
-                    break
-
-            try:
-                if value:
-                    field.select_option(value=value)
-                else:
-                    field.select_option(label=selected)
-            except Exception:
-                continue
-
-    def _fill_radio_inputs(self, page: Page, job: JobPosting) -> None:
-        radios = page.locator("input[type='radio']")
-        count = min(radios.count(), 300)
-        names: set[str] = set()
-        for i in range(count):
-            name = (radios.nth(i).get_attribute("name") or "").strip()
-            if name:
-                names.add(name)
+            pending.append((question, partial(self._apply_select_answer, page, field)))
+        return pending
+
+    def _apply_select_answer(self, page: Page, field: dict, answer: str) -> None:
+        options = field["options"]
+        labels = [item["label"] for item in options]
+        selected = ""
+        if answer:
+            selected = self._best_choice(answer, labels)
+
+        if not selected:
+            selected = labels[0]
+
+        value = ""
+        for opt in options:
+            if opt["label"] == selected:
+                value = opt["value"]
+                break
 
-        for name in names:
-            group = page.locator(f"input[type='radio'][name='{name}']")
-            if group.count() == 0:
-                continue
-            if self._radio_group_has_checked(group):
+        locator = self._field_locator(page, field)
+        if value:
+            locator.select_option(value=value)
+        else:
+            locator.select_option(label=selected)
+
+    def _radio_questions(
+        self, page: Page, groups: dict[str, list[dict]]
+    ) -> list[_PendingQuestion]:
+        pending: list[_PendingQuestion] = []
+        for group in groups.values():
+            radios = group[:30]
+            if any(radio["checked"] for radio in radios):
                 continue
 
-            prompt = self._radio_prompt(page, group.first)
-            options = self._radio_group_labels(page, group)
-            if not options:
+            visible = [radio for radio in radios if radio["visible"]]
+            if not visible:
                 continue
-            answer = self.question_answerer.answer(
-                prompt=prompt,
+            options = [
+                radio["prompt"] or radio["value"] or f"Option {i + 1}"
+                for i, radio in enumerate(visible)
+            ]
+            first = radios[0]
+            question = ApplicationQuestion(
+                prompt=first["legend"] or first["prompt"],
                 input_type="radio",
-                job=job,
                 choices=options,
             )
-            selected = self._best_choice(answer, options) if answer else options[0]
-            index = options.index(selected) if selected in options else 0
-            try:
-                group.nth(index).check(force=True)
-            except Exception:
+            pending.append((question, partial(self._apply_radio_answer, page, visible, options)))
+        return pending
+
+    def _apply_radio_answer(
+        self, page: Page, radios: list[dict], options: list[str], answer: str
+    ) -> None:
+        selected = self._best_choice(answer, options) if answer else options[0]
+        index = options.index(selected) if selected in options else 0
+        self._field_locator(page, radios[index]).check(force=True)
+
+    def _fill_checkboxes(self, page: Page, fields: list[dict]) -> None:
+        for field in fields:
+            if not field["visible"] or field["disabled"] or field["checked"]:
                 continue
-
-    def _fill_checkboxes(self, page: Page) -> None:
-        boxes = page.locator("input[type='checkbox']")
-        count = min(boxes.count(), 200)
-        for i in range(count):
-            box = boxes.nth(i)
-            if not self._is_visible(box):
-                continue
-            if self._is_disabled(box):
-                continue
-            try:
-                if box.is_checked():
-                    continue
-            except Exception:
-                continue
-
-            prompt = self._prompt_for_input(page, box).lower()
-            if any(
-                token in prompt
-                for token in (
-                    "agree",
-                    "consent",
-                    "acknowledge",
-                    "certify",
-                    "privacy",
-                    "terms",
-                )
-            ):
+            prompt = field["prompt"].lower()
+            if any(token in prompt for token in _CONSENT_TOKENS):
                 try:
-                    box.check(force=True)
+                    self._field_locator(page, field).check(force=True)
                 except Exception:
                     continue
 
-    def _upload_resume_if_visible(self, page: Page, resume_path: Path) -> bool:
+    @staticmethod
+    def _field_locator(page: Page, field: dict) -> Locator:
+        return page.locator(f"[{_FIELD_MARKER}='{field['idx']}']")
+
+    def _upload_resume_if_visible(self, page: Page, resume: Future[Path]) -> bool:
         uploaders = page.locator("input[type='file']")
         count = min(uploaders.count(), 20)
         for i in range(count):
             uploader = uploaders.nth(i)
             if not self._is_visible(uploader):
                 continue
+            # Build failures propagate and fail the application.
+            resume_path = resume.result()
             try:
+                self._watch_dom(page)
                 uploader.set_input_files(str(resume_path.resolve()))
                 LOGGER.info("Uploaded resume: %s", resume_path.name)
-                page.wait_for_timeout(1000)
+                self._wait_for_dom(page)
                 return True
             except Exception:
                 continue
         return False
 
     def _click_apply(self, page: Page) -> bool:
-        page.wait_for_timeout(800)
-        patterns = [
-            re.compile(r"easy apply", re.IGNORECASE),
-            re.compile(r"quick apply", re.IGNORECASE),
-            re.compile(r"apply now", re.IGNORECASE),
-            re.compile(r"^apply$", re.IGNORECASE),
-        ]
-        if self._click_button(page, patterns):
-            page.wait_for_timeout(900)
+        try:
+            page.locator("button, a").filter(has_text=_APPLY_TEXT_RE).first.wait_for(
+                state="visible", timeout=2000
+            )
+        except PlaywrightTimeoutError:
+            pass
+        self._watch_dom(page)
+        if self._click_button(page, _APPLY_BUTTONS):
+            self._wait_for_dom(page, timeout_ms=3000)
             return True
 
         links = page.locator("a:has-text('Apply')")
         if links.count() > 0 and self._is_visible(links.first):
             try:
                 links.first.click()
-                page.wait_for_timeout(900)
+                self._wait_for_dom(page, timeout_ms=3000)
                 return True
             except Exception:
                 return False
         return False
 
     def _has_submit_button(self, page: Page) -> bool:
-        patterns = [
-            re.compile(r"submit", re.IGNORECASE),
-            re.compile(r"send application", re.IGNORECASE),
-            re.compile(r"finish", re.IGNORECASE),
-        ]
-        for pattern in patterns:
-            button = page.get_by_role("button", name=pattern)
-            if button.count() > 0 and self._is_visible(button.first):
-                return True
-        return False
+        button = page.get_by_role("button", name=_SUBMIT_BUTTON_RE)
+        return button.count() > 0 and self._is_visible(button.first)
 
     def _click_submit(self, page: Page) -> None:
-        patterns = [
-            re.compile(r"submit", re.IGNORECASE),
-            re.compile(r"send application", re.IGNORECASE),
-            re.compile(r"finish", re.IGNORECASE),
-        ]
-        if self._click_button(page, patterns):
-            page.wait_for_timeout(1500)
+        if self._click_button(page, _SUBMIT_BUTTONS):
+            # Done once the submit button is gone (dialog closed or page replaced).
+            try:
+                page.get_by_role("button", name=_SUBMIT_BUTTON_RE).first.wait_for(
+                    state="hidden", timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                pass
             return
         raise RuntimeError("Submit button not clickable")
 
     def _click_next_step(self, page: Page) -> bool:
-        patterns = [
-            re.compile(r"next", re.IGNORECASE),
-            re.compile(r"continue", re.IGNORECASE),
-            re.compile(r"review", re.IGNORECASE),
-            re.compile(r"save and continue", re.IGNORECASE),
-        ]
-        return self._click_button(page, patterns)
-
-    @staticmethod
-    def _extract_job_id(url: str, index_fallback: int) -> str:
-        match = re.search(r"/(?:jobs|postings)/(\d+)", url)
-        if match:
-            return match.group(1)
-        return f"idx-{index_fallback}"
+        self._watch_dom(page)
+        if not self._click_button(page, _NEXT_BUTTONS):
+            return False
+        self._wait_for_dom(page)
+        return True
 
     @staticmethod
     def _first_text(page: Page, selectors: list[str]) -> str:
@@ -662,9 +1120,44 @@ class HandshakeBot:
         )
 
     @staticmethod
-    def _safe_wait(page: Page, milliseconds: int) -> None:
+    def _settle(page: Page, timeout_ms: int = 2000) -> None:
+        """After a goto: wait for the network to go quiet (capped), plus a short floor."""
         try:
-            page.wait_for_timeout(milliseconds)
+            page.wait_for_load_state("networkidle", timeout=timeout_ms)
+            page.wait_for_timeout(_SETTLE_FLOOR_MS)
+        except PlaywrightTimeoutError:
+            pass
+        except PlaywrightError as exc:
+            if "closed" in str(exc).lower():
+                raise RuntimeError(
+                    "Browser page was closed during login/apply flow. Keep it open while automation runs."
+                ) from exc
+            raise
+
+    @staticmethod
+    def _watch_dom(page: Page) -> None:
+        """Start recording DOM changes; call right before an in-page action."""
+        try:
+            page.evaluate(_DOM_WATCH_JS)
+        except PlaywrightError as exc:
+            if "closed" in str(exc).lower():
+                raise RuntimeError(
+                    "Browser page was closed during login/apply flow. Keep it open while automation runs."
+                ) from exc
+            raise
+
+    def _wait_for_dom(self, page: Page, timeout_ms: int = 2000) -> bool:
+        """Wait until the DOM changed after _watch_dom and has since been quiet."""
+        return self._wait_until(page, _DOM_SETTLED_JS, _DOM_QUIET_MS, timeout_ms)
+
+    @staticmethod
+    def _wait_until(page: Page, predicate_js: str, arg: object, timeout_ms: int) -> bool:
+        """Poll a page predicate; False if it never held within the timeout."""
+        try:
+            page.wait_for_function(predicate_js, arg=arg, timeout=timeout_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
         except PlaywrightError as exc:
             if "closed" in str(exc).lower():
                 raise RuntimeError(
@@ -684,18 +1177,17 @@ class HandshakeBot:
             raise
 
     @staticmethod
-    def _click_button(page: Page, patterns: list[re.Pattern[str]]) -> bool:
+    def _click_button(page: Page, patterns: tuple[re.Pattern[str], ...]) -> bool:
         for pattern in patterns:
+            # get_by_role already skips hidden buttons; disabled=False skips disabled ones.
+            button = page.get_by_role("button", name=pattern, disabled=False)
             try:
-                button = page.get_by_role("button", name=pattern)
                 if button.count() == 0:
                     continue
                 target = button.first
-                if target.is_visible() and target.is_enabled():
+                if target.is_visible():
                     target.click()
                     return True
-            except PlaywrightTimeoutError:
-                continue
             except Exception:
                 continue
         return False
@@ -707,93 +1199,6 @@ class HandshakeBot:
         except Exception:
             return False
 
-    @staticmethod
-    def _is_disabled(locator: Locator) -> bool:
-        try:
-            return locator.is_disabled()
-        except Exception:
-            return False
-
-    @staticmethod
-    def _input_value(locator: Locator) -> str:
-        try:
-            return locator.input_value()
-        except Exception:
-            return ""
-
-    def _prompt_for_input(self, page: Page, locator: Locator) -> str:
-        input_id = (locator.get_attribute("id") or "").strip()
-        if input_id:
-            label = page.locator(f"label[for='{input_id}']")
-            if label.count() > 0:
-                text = (label.first.inner_text() or "").strip()
-                if text:
-                    return text
-
-        for attr in ("aria-label", "placeholder", "name"):
-            value = (locator.get_attribute(attr) or "").strip()
-            if value:
-                return value
-
-        try:
-            text = locator.evaluate(
-                "el => (el.closest('label')?.innerText || el.closest('fieldset')?.querySelector('legend')?.innerText || '').trim()"
-            )
-            if text:
-                return str(text)
-        except Exception:
-            return "Application question"
-        return "Application question"
-
-    @staticmethod
-    def _select_options(select: Locator) -> list[dict[str, str]]:
-        try:
-            data = select.evaluate(
-                """el => Array.from(el.options).map(opt => ({
-                    label: (opt.textContent || '').trim(),
-                    value: opt.value || ''
-                })).filter(x => x.label && x.label.toLowerCase() !== 'select')
-                """
-            )
-            return data if isinstance(data, list) else []
-        except Exception:
-            return []
-
-    def _radio_prompt(self, page: Page, radio: Locator) -> str:
-        try:
-            legend = radio.evaluate(
-                "el => (el.closest('fieldset')?.querySelector('legend')?.innerText || '').trim()"
-            )
-            if legend:
-                return str(legend)
-        except Exception:
-            pass
-        return self._prompt_for_input(page, radio)
-
-    def _radio_group_labels(self, page: Page, group: Locator) -> list[str]:
-        labels: list[str] = []
-        count = min(group.count(), 30)
-        for i in range(count):
-            radio = group.nth(i)
-            if not self._is_visible(radio):
-                continue
-            label = self._prompt_for_input(page, radio)
-            value = (radio.get_attribute("value") or "").strip()
-            choice = label or value or f"Option {i + 1}"
-            labels.append(choice)
-        return labels
-
-    @staticmethod
-    def _radio_group_has_checked(group: Locator) -> bool:
-        count = min(group.count(), 30)
-        for i in range(count):
-            try:
-                if group.nth(i).is_checked():
-                    return True
-            except Exception:
-                continue
-        return False
-
     @staticmethod
     def _best_choice(answer: str, options: list[str]) -> str:
         if not answer:
@@ -805,23 +1210,3 @@ class HandshakeBot:
             if option.lower() in answer.lower() or answer.lower() in option.lower():
                 return option
         return ""
-
-    @staticmethod
-    def _write_results(results: list[ApplicationResult]) -> None:
-        out_path = Path("artifacts/application_results.jsonl")
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_path.open("w") as f:
-            for result in results:
-                f.write(
-                    json.dumps(
-                        {
-                            "job_id": result.job_id,
-                            "title": result.title,
-                            "company": result.company,
-                            "url": result.url,
-                            "status": result.status,
-                            "reason": result.reason,
-                        }
-                    )
-                    + "\n"
-                )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import re
+
+from .models import JobPosting
+from .settings import FilterConfig
+
+
+def keyword_pattern(keywords: list[str]) -> re.Pattern[str] | None:
+    """One alternation regex per keyword list, so a job's text is scanned once.
+
+    Matches plain substrings of the lowercased text, like the `in` checks it
+    replaces; returns None for an empty list.
+    """
+    terms = sorted({kw.lower() for kw in keywords if kw.strip()}, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+class JobFilter:
+    """Include/exclude/location checks for a posting, compiled once per config."""
+
+    def __init__(self, config: FilterConfig):
+        self._include_re = keyword_pattern(config.include_keywords)
+        self._exclude_re = keyword_pattern(config.exclude_keywords)
+        self._preferred_location_re = keyword_pattern(config.preferred_locations)
+        self._remote_only = config.remote_only
+
+    def matches(self, job: JobPosting) -> bool:
+        text = f"{job.title}\n{job.company}\n{job.location}\n{job.description}".lower()
+
+        if self._include_re and not self._include_re.search(text):
+            return False
+        if self._exclude_re and self._exclude_re.search(text):
+            return False
+        if self._remote_only and "remote" not in text:
+            return False
+        if self._preferred_location_re and not self._preferred_location_re.search(text):
+            return False
+        return True
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+
+# Selectors for the job page fields, in priority order per field. Mirrors the
+# CSS selectors they replace: "*=" is a substring test, "=" an exact one.
+_FIELD_MATCHERS: tuple[tuple[str, str, str, str, str], ...] = (
+    # (field, tag or "*", attribute, operator, value)
+    ("title", "h1", "", "", ""),
+    ("company", "a", "href", "*=", "/employers/"),
+    ("company", "*", "data-testid", "=", "employer-name"),
+    ("company", "*", "data-qa", "=", "employer-name"),
+    ("location", "*", "data-testid", "=", "location"),
+    ("location", "*", "data-qa", "=", "job-location"),
+    ("description", "main", "", "", ""),
+    ("description", "article", "", "", ""),
+)
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+
+
+class _JobPageParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        # Text per _FIELD_MATCHERS index, from the first element it matched
+        # that had any text.
+        self.chunks: dict[int, list[str]] = {}
+        # Open captures as [matcher index, tag, same-tag nesting depth].
+        self._open: list[list] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if tag in _VOID_TAGS:
+            return
+        for capture in self._open:
+            if capture[1] == tag:
+                capture[2] += 1
+        attr_map = {name: value or "" for name, value in attrs}
+        for index, (_, want_tag, attr, op, value) in enumerate(_FIELD_MATCHERS):
+            # An element without text lets a later element try the same matcher.
+            if self.chunks.get(index) or any(c[0] == index for c in self._open):
+                continue
+            if want_tag not in ("*", tag):
+                continue
+            if attr:
+                actual = attr_map.get(attr)
+                if actual is None:
+                    continue
+                matched = actual == value if op == "=" else value in actual
+                if not matched:
+                    continue
+            self.chunks[index] = []
+            self._open.append([index, tag, 1])
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        for capture in self._open:
+            if capture[1] == tag:
+                capture[2] -= 1
+        self._open = [capture for capture in self._open if capture[2] > 0]
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth or not self._open:
+            return
+        text = data.strip()
+        if text:
+            for capture in self._open:
+                self.chunks[capture[0]].append(text)
+
+
+def parse_job_page(html: str) -> dict[str, str]:
+    """Pull title/company/location/description out of server-rendered job HTML.
+
+    Returns only the fields that were found with non-empty text.
+    """
+    parser = _JobPageParser()
+    parser.feed(html)
+    parser.close()
+
+    # Each field comes from its highest-priority matcher with text, wherever
+    # that element sits in the document.
+    fields: dict[str, str] = {}
+    for index, (field, *_) in enumerate(_FIELD_MATCHERS):
+        chunks = parser.chunks.get(index)
+        if field in fields or not chunks:
+            continue
+        if field == "description":
+            fields[field] = "\n".join(chunks)
+        else:
+            fields[field] = " ".join(" ".join(chunks).split())
+    return fields
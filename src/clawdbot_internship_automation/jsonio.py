@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Stdlib options that match orjson's output: compact separators, raw UTF-8.
+_COMPACT_UTF8: dict[str, Any] = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def loads(text: str) -> Any:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def dumps(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, **_COMPACT_UTF8)
+
+
+# The stdout whose text layer write_json has already flushed once.
+_flushed_stdout: Any = None
+
+
+def write_json(payload: Any) -> None:
+    """Write one JSON line as bytes; the buffer is flushed at interpreter shutdown."""
+    global _flushed_stdout
+    # Same compact UTF-8 bytes whether or not orjson is installed.
+    if orjson is not None:
+        data = orjson.dumps(payload) + b"\n"
+    else:
+        data = (json.dumps(payload, **_COMPACT_UTF8) + "\n").encode()
+    if sys.stdout is not _flushed_stdout:
+        # Text printed before the first payload may still sit in the text layer
+        # and must go out first; with nothing printed this writes nothing. The
+        # CLIs write one payload, and text printed after it is flushed behind
+        # it at exit, so later payloads skip this.
+        sys.stdout.flush()
+        _flushed_stdout = sys.stdout
+    sys.stdout.buffer.write(data)
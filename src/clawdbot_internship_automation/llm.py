@@ -1,28 +1,117 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
 import os
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
-from .models import JobPosting
+from .jsonio import loads
+from .llm_cache import LLMResponseCache, SemanticCache
+from .models import ApplicationQuestion, JobPosting
 from .settings import LLMConfig
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional import at runtime
-    OpenAI = None
+# Above this the same prompt is expected to vary, so replies aren't reused.
+_CACHEABLE_MAX_TEMPERATURE = 0.2
+
+# Characters of job description / resume text sent with a prompt.
+_PROMPT_TEXT_LIMIT = 5000
+
+_MAX_TOP_SKILLS = 8
+_MAX_HIGHLIGHTS = 6
+
+# Structured output for generate_resume_sections, so replies always parse.
+_RESUME_SECTIONS_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "resume_sections",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summary": {"type": "string"},
+                "top_skills": {"type": "array", "items": {"type": "string"}},
+                "experience_highlights": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["summary", "top_skills", "experience_highlights"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_JSON_OBJECT_FORMAT: dict[str, Any] = {"type": "json_object"}
+
+_HTTP_MAX_CONNECTIONS = 32
+_HTTP_MAX_KEEPALIVE = 16
+_HTTP_TIMEOUT_SEC = 60.0
+
+
+def _stripped(value: Any) -> str:
+    return str(value).strip()
+
+
+def coerce_answer(answer: str, choices: list[str], default_answer: str) -> str:
+    """Map a raw model reply onto the allowed choices, falling back to the default."""
+    answer = answer.strip()
+    if not answer:
+        return default_answer
+
+    if choices:
+        lowered = {c.lower(): c for c in choices}
+        if answer.lower() in lowered:
+            return lowered[answer.lower()]
+        for choice in choices:
+            if choice.lower() in answer.lower():
+                return choice
+        return default_answer if default_answer in choices else choices[0]
+
+    return answer
 
 
 class LLMClient:
     def __init__(self, config: LLMConfig):
         self.config = config
         self._client = None
+        self._http = None
         api_key = os.getenv(config.api_key_env, "")
-        if config.enabled and config.provider.lower() == "openai" and api_key and OpenAI:
-            self._client = OpenAI(api_key=api_key)
+        if config.enabled and config.provider.lower() == "openai" and api_key:
+            try:
+                import httpx
+                from openai import OpenAI
+            except Exception:  # pragma: no cover - optional import at runtime
+                OpenAI = None
+            if OpenAI:
+                # One pooled connection reused across calls and worker threads.
+                self._http = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(
+                        max_connections=_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+                    ),
+                    timeout=_HTTP_TIMEOUT_SEC,
+                )
+                self._client = OpenAI(api_key=api_key, http_client=self._http)
+
+        self._cache = None
+        if config.cache_enabled and config.temperature <= _CACHEABLE_MAX_TEMPERATURE:
+            self._cache = LLMResponseCache(
+                Path("artifacts/llm_cache"), ttl_sec=config.cache_ttl_hours * 3600
+            )
+
+        self._semantic_cache = None
+        if config.semantic_cache_enabled:
+            self._semantic_cache = SemanticCache(
+                Path("artifacts/llm_cache/resume_sections.jsonl"),
+                threshold=config.semantic_cache_threshold,
+                ttl_sec=config.cache_ttl_hours * 3600,
+            )
+
+        # response_format types the backend has rejected; see _chat.
+        self._rejected_formats: set[str] = set()
 
         if config.enabled and self._client is None:
             LOGGER.warning(
@@ -35,24 +124,94 @@ class LLMClient:
     def enabled(self) -> bool:
         return self._client is not None
 
-    def _chat(self, system_prompt: str, user_prompt: str) -> str:
+    def close(self) -> None:
+        """Release pooled connections; the client is disabled afterwards."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        self._client = None
+
+    def _chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_format: dict[str, Any] | None = None,
+    ) -> str:
         if not self._client:
             return ""
 
+        cache_key = self._cache_key(system_prompt, user_prompt, response_format)
+        if cache_key:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Backends without structured outputs reject json_schema (and some
+        # json_object) with a 400; step down to the next format instead of
+        # losing the reply, and remember the rejection for later calls.
+        formats: list[dict[str, Any] | None] = [response_format]
+        if response_format is not None:
+            if response_format.get("type") == "json_schema":
+                formats.append(_JSON_OBJECT_FORMAT)
+            formats.append(None)
+        formats = [f for f in formats if f is None or f["type"] not in self._rejected_formats]
+
+        message = ""
+        for request_format in formats:
+            extra: dict[str, Any] = {}
+            if request_format is not None:
+                extra["response_format"] = request_format
+            try:
+                completion = self._client.chat.completions.create(
+                    model=self.config.model,
+                    temperature=self.config.temperature,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    **extra,
+                )
+                message = (completion.choices[0].message.content or "").strip()
+                break
+            except Exception as exc:
+                if request_format is None or getattr(exc, "status_code", None) not in (400, 422):
+                    LOGGER.warning("LLM request failed: %s", exc)
+                    return ""
+                LOGGER.warning(
+                    "LLM backend rejected response_format %s (%s); retrying without it.",
+                    request_format["type"],
+                    exc,
+                )
+                self._rejected_formats.add(request_format["type"])
+
+        if message and self._cache is not None:
+            self._cache.put(cache_key, message)
+        return message
+
+    def _cache_key(
+        self, system_prompt: str, user_prompt: str, response_format: dict[str, Any] | None
+    ) -> str:
+        if self._cache is None:
+            return ""
+        return self._cache.key(
+            self.config.model,
+            self.config.temperature,
+            system_prompt,
+            user_prompt,
+            response_format,
+        )
+
+    def _embed(self, text: str) -> list[float] | None:
+        if not self._client:
+            return None
         try:
-            completion = self._client.chat.completions.create(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+            response = self._client.embeddings.create(
+                model=self.config.embedding_model, input=text
             )
-            message = completion.choices[0].message.content
-            return (message or "").strip()
+            return list(response.data[0].embedding)
         except Exception as exc:
-            LOGGER.warning("LLM request failed: %s", exc)
-            return ""
+            LOGGER.warning("Embedding request failed: %s", exc)
+            return None
 
     def generate_resume_sections(
         self, job: JobPosting, base_resume_text: str
@@ -69,53 +228,94 @@ class LLMClient:
         if not self.enabled:
             return default
 
+        description = job.description[:_PROMPT_TEXT_LIMIT]
         system = (
-            "You tailor internship resumes. Return only strict JSON with keys "
-            "'summary', 'top_skills', 'experience_highlights'. "
-            "top_skills and experience_highlights must be arrays of short strings."
+            "You tailor internship resumes. Reply with a JSON object with keys "
+            "'summary', 'top_skills' and 'experience_highlights'. Keep top_skills to "
+            "at most 8 and experience_highlights to at most 6 short strings."
         )
         user = (
             f"Job Title: {job.title}\n"
             f"Company: {job.company}\n"
             f"Location: {job.location}\n"
-            f"Job Description:\n{job.description[:5000]}\n\n"
-            f"Candidate Resume Text:\n{base_resume_text[:5000]}\n\n"
+            f"Job Description:\n{description}\n\n"
+            f"Candidate Resume Text:\n{base_resume_text[:_PROMPT_TEXT_LIMIT]}\n\n"
             "Create a targeted but truthful internship resume angle."
         )
-        raw = self._chat(system, user)
+
+        # Near-duplicate postings (same role re-listed, sibling teams) would get
+        # near-identical sections, so reuse those instead of a full generation.
+        # An exact cached reply is cheaper still, so check it before embedding.
+        embedding = None
+        semantic_scope = ""
+        cache_key = self._cache_key(system, user, _RESUME_SECTIONS_FORMAT)
+        if self._semantic_cache is not None and not (
+            cache_key and self._cache.get(cache_key) is not None
+        ):
+            semantic_scope = SemanticCache.scope(
+                self.config.model, self.config.embedding_model, base_resume_text
+            )
+            embedding = self._embed(f"{job.title}\n{job.company}\n{description}")
+            if embedding is not None:
+                cached = self._semantic_cache.lookup(embedding, semantic_scope)
+                if cached is not None:
+                    return cached
+
+        raw = self._chat(system, user, response_format=_RESUME_SECTIONS_FORMAT)
         if not raw:
             return default
 
+        # Without structured outputs the object may come wrapped in prose or a
+        # code fence; otherwise this only guards truncated replies.
         try:
-            parsed = json.loads(raw)
-            summary = str(parsed.get("summary", default["summary"])).strip()
-            top_skills = [
-                str(item).strip() for item in parsed.get("top_skills", default["top_skills"])
-            ]
-            highlights = [
-                str(item).strip()
-                for item in parsed.get(
-                    "experience_highlights", default["experience_highlights"]
+            parsed = loads(raw[raw.index("{") : raw.rindex("}") + 1])
+            summary = _stripped(parsed.get("summary", default["summary"]))
+            # One pass per field: strip, drop empties, stop at the limit.
+            top_skills = list(
+                islice(
+                    filter(None, map(_stripped, parsed.get("top_skills", default["top_skills"]))),
+                    _MAX_TOP_SKILLS,
                 )
-            ]
-            return {
+            )
+            highlights = list(
+                islice(
+                    filter(
+                        None,
+                        map(
+                            _stripped,
+                            parsed.get("experience_highlights", default["experience_highlights"]),
+                        ),
+                    ),
+                    _MAX_HIGHLIGHTS,
+                )
+            )
+            sections = {
                 "summary": summary or default["summary"],
-                "top_skills": [s for s in top_skills if s][:8] or default["top_skills"],
-                "experience_highlights": [h for h in highlights if h][:6]
-                or default["experience_highlights"],
+                "top_skills": top_skills or default["top_skills"],
+                "experience_highlights": highlights or default["experience_highlights"],
             }
         except Exception:
             return default
 
+        if embedding is not None and self._semantic_cache is not None:
+            self._semantic_cache.add(embedding, sections, semantic_scope)
+        return sections
+
     def answer_application_question(
         self,
         prompt: str,
         job: JobPosting,
         default_answer: str,
         allowed_choices: list[str] | None = None,
+        coerce: bool = True,
     ) -> str:
+        """Ask the model one question.
+
+        With ``coerce=False`` the stripped raw reply is returned ("" when there
+        is none) and the caller is responsible for calling `coerce_answer`.
+        """
         if not self.enabled:
-            return default_answer
+            return default_answer if coerce else ""
 
         choices = allowed_choices or []
         system = (
@@ -129,17 +329,66 @@ class LLMClient:
             f"Allowed choices: {choices}\n"
             f"Default answer: {default_answer}\n"
         )
-        answer = self._chat(system, user).strip()
-        if not answer:
-            return default_answer
-
-        if choices:
-            lowered = {c.lower(): c for c in choices}
-            if answer.lower() in lowered:
-                return lowered[answer.lower()]
-            for choice in choices:
-                if choice.lower() in answer.lower():
-                    return choice
-            return default_answer if default_answer in choices else choices[0]
-
-        return answer
+        reply = self._chat(system, user)
+        return coerce_answer(reply, choices, default_answer) if coerce else reply.strip()
+
+    def answer_application_questions(
+        self,
+        questions: list[ApplicationQuestion],
+        job: JobPosting,
+        default_answers: list[str],
+        coerce: bool = True,
+    ) -> list[str]:
+        """Answer several questions with one chat call; results align with `questions`.
+
+        Anything the model skips or garbles falls back to its default answer,
+        unless ``coerce=False`` asks for the raw replies as in
+        `answer_application_question`.
+        """
+        if not self.enabled or not questions:
+            return list(default_answers) if coerce else [""] * len(questions)
+        if len(questions) == 1:
+            return [
+                self.answer_application_question(
+                    prompt=questions[0].prompt,
+                    job=job,
+                    default_answer=default_answers[0],
+                    allowed_choices=questions[0].choices,
+                    coerce=coerce,
+                )
+            ]
+
+        system = (
+            "You answer internship application questions concisely and truthfully. "
+            "The user sends a JSON array of questions with id, question, choices and default. "
+            'Reply with only a JSON array of {"id": <id>, "answer": <string>} objects. '
+            "If choices are given, answer with one exact choice. "
+            "Otherwise keep each answer to one sentence."
+        )
+        payload = [
+            {
+                "id": index,
+                "question": question.prompt,
+                "choices": question.choices,
+                "default": default,
+            }
+            for index, (question, default) in enumerate(zip(questions, default_answers))
+        ]
+        user = f"Job: {job.title} at {job.company}\nQuestions:\n{json.dumps(payload)}"
+        raw = self._chat(system, user)
+
+        answers: dict[int, str] = {}
+        try:
+            parsed = loads(raw[raw.index("[") : raw.rindex("]") + 1])
+            for item in parsed:
+                answers[int(item["id"])] = str(item.get("answer") or "")
+        except Exception:
+            if raw:
+                LOGGER.warning("Could not parse batched LLM answers; using defaults.")
+
+        if not coerce:
+            return [answers.get(index, "").strip() for index in range(len(questions))]
+        return [
+            coerce_answer(answers.get(index, ""), question.choices or [], default)
+            for index, (question, default) in enumerate(zip(questions, default_answers))
+        ]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import operator
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .jsonio import dumps, loads
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Chat replies stored one JSON file per request hash, expired by file age."""
+
+    def __init__(self, directory: Path, ttl_sec: float):
+        self.directory = directory
+        self.ttl_sec = ttl_sec
+
+    @staticmethod
+    def key(
+        model: str,
+        temperature: float,
+        system: str,
+        user: str,
+        response_format: dict[str, Any] | None = None,
+    ) -> str:
+        fields: dict[str, Any] = {"m": model, "t": temperature, "s": system, "u": user}
+        if response_format is not None:
+            fields["f"] = response_format
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl_sec:
+                return None
+            content = loads(path.read_text())["content"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return content if isinstance(content, str) else None
+
+    def put(self, key: str, content: str) -> None:
+        path = self._path(key)
+        tmp_name = ""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, prefix=".tmp-", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(dumps({"content": content}))
+            os.replace(tmp_name, path)
+        except OSError:
+            if tmp_name:
+                Path(tmp_name).unlink(missing_ok=True)
+
+
+class SemanticCache:
+    """Reuses a stored result when a new embedding is close enough to an old one.
+
+    Entries are appended to a JSONL file as (unit-length embedding, value), so
+    cosine similarity is a plain dot product. Each entry carries a scope (the
+    inputs besides the embedded text that shaped the value) and only matches
+    lookups in the same scope; entries older than ``ttl_sec`` are ignored.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Path, threshold: float, ttl_sec: float):
+        self.path = path
+        self.threshold = threshold
+        self.ttl_sec = ttl_sec
+        self._entries: list[tuple[str, float, list[float], Any]] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scope(*parts: str) -> str:
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def _normalized(vector: list[float]) -> list[float]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def _load(self) -> list[tuple[str, float, list[float], Any]]:
+        entries: list[tuple[str, float, list[float], Any]] = []
+        try:
+            with self.path.open() as f:
+                for line in f:
+                    try:
+                        item = loads(line)
+                        entries.append(
+                            (item["scope"], float(item["ts"]), item["embedding"], item["value"])
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            LOGGER.warning("Ignoring unreadable semantic cache %s: %s", self.path, exc)
+        return entries
+
+    def lookup(self, embedding: list[float], scope: str) -> Any | None:
+        query = self._normalized(embedding)
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            entries = list(self._entries)
+
+        oldest = time.time() - self.ttl_sec
+        best_value, best_score = None, self.threshold
+        for entry_scope, ts, stored, value in entries:
+            if entry_scope != scope or ts <= oldest or len(stored) != len(query):
+                continue
+            score = sum(map(operator.mul, stored, query))
+            if score >= best_score:
+                best_value, best_score = value, score
+        return best_value
+
+    def add(self, embedding: list[float], value: Any, scope: str) -> None:
+        vector = self._normalized(embedding)
+        ts = time.time()
+        line = dumps({"scope": scope, "ts": ts, "embedding": vector, "value": value}) + "\n"
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._entries.append((scope, ts, vector, value))
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a") as f:
+                    f.write(line)
+            except OSError as exc:
+                LOGGER.warning("Could not persist semantic cache entry: %s", exc)
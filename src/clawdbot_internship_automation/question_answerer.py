@@ -1,13 +1,43 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-import yaml
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
 
-from .llm import LLMClient
-from .models import JobPosting
-from .settings import QAConfig
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not on Windows
+    fcntl = None
+
+from .jsonio import dumps, loads
+from .llm import LLMClient, coerce_answer
+from .models import ApplicationQuestion, JobPosting
+from .settings import QAConfig, read_yaml
+
+LOGGER = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Words that vary between rewordings of the same question without changing it.
+_SKELETON_STOPWORDS = frozenset(
+    "a an the at in of for to please you your do are is currently".split()
+)
+_ANSWER_CACHE_VERSION = 1
+
+# Bound on remembered prompt defaults; a long-lived daemon sees many postings.
+_KNOWN_DEFAULTS_MAX = 4096
 
 
 @dataclass(slots=True)
@@ -16,18 +46,131 @@ class AliasRule:
     patterns: list[str]
 
 
+class _AnswerCache:
+    """Earlier LLM answers keyed by question skeleton, input type, choices and default.
+
+    Only multiple-choice answers are stored: they carry over between companies,
+    while free-text answers tend to be specific to one posting. Entries expire
+    after ``ttl_sec``. The CLI and the daemon share the file, so reads pick up
+    the other process's writes and each write merges into the file under a lock.
+    """
+
+    def __init__(self, path: Path, ttl_sec: float):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self._entries: dict[str, dict] = {}
+        self._stamp: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        prompt_norm: str, input_type: str, choices: list[str], company: str, default_answer: str
+    ) -> str:
+        if company:
+            prompt_norm = prompt_norm.replace(company.lower(), " ")
+        skeleton = " ".join(
+            word for word in _WORD_RE.findall(prompt_norm) if word not in _SKELETON_STOPWORDS
+        )
+        # The default steers the LLM's pick; a changed qa_defaults entry starts afresh.
+        default_digest = hashlib.blake2b(default_answer.encode(), digest_size=8).hexdigest()
+        return "|".join(
+            [input_type, skeleton, default_digest, *sorted(choice.lower() for choice in choices)]
+        )
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            raw = loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            LOGGER.warning("Ignoring unreadable answer cache %s: %s", self.path, exc)
+            return {}
+        if not isinstance(raw, dict) or raw.get("version") != _ANSWER_CACHE_VERSION:
+            return {}
+        entries = raw.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _refresh(self) -> None:
+        """Re-read the file if another process replaced it since we last looked."""
+        try:
+            st = self.path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp != self._stamp:
+            self._entries = self._read() if stamp else {}
+            self._stamp = stamp
+
+    def _fresh(self, entry: Any, now: float) -> bool:
+        return isinstance(entry, dict) and now - float(entry.get("ts", 0)) < self.ttl_sec
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            yield
+
+    def get(self, key: str) -> str:
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(key)
+        if not self._fresh(entry, time.time()):
+            return ""
+        return str(entry.get("answer", ""))
+
+    def put(self, key: str, answer: str) -> None:
+        with self._lock:
+            self._refresh()
+            now = time.time()
+            entry = self._entries.get(key)
+            if self._fresh(entry, now) and entry.get("answer") == answer:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._file_lock():
+                    # Merge into what is on disk now, not our possibly stale copy.
+                    entries = {k: e for k, e in self._read().items() if self._fresh(e, now)}
+                    entries[key] = {"ts": now, "answer": answer}
+                    tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                    payload = {"version": _ANSWER_CACHE_VERSION, "entries": entries}
+                    tmp_path.write_text(dumps(payload))
+                    os.replace(tmp_path, self.path)
+                self._entries = entries
+                self._stamp = None
+            except OSError as exc:
+                LOGGER.warning("Could not save answer cache: %s", exc)
+
+
 class QuestionAnswerer:
     def __init__(self, qa_config: QAConfig, llm: LLMClient):
         self.qa_config = qa_config
         self.llm = llm
         self.defaults, self.alias_rules = self._load_defaults(Path(qa_config.defaults_path))
+        # (pattern, key) pairs in rule order, so the earliest rule still wins.
+        self._alias_patterns = [
+            (pattern, rule.key) for rule in self.alias_rules for pattern in rule.patterns if pattern
+        ]
+        self._alias_automaton = self._build_alias_automaton(self.alias_rules)
+        # Normalized prompt -> alias/heuristic default; the same labels recur on every form.
+        self._known_defaults: dict[str, str] = {}
+        self._answer_cache = (
+            _AnswerCache(
+                Path(qa_config.answer_cache_path),
+                ttl_sec=qa_config.answer_cache_ttl_hours * 3600,
+            )
+            if qa_config.answer_cache_path and qa_config.answer_cache_ttl_hours > 0
+            else None
+        )
 
     @staticmethod
     def _load_defaults(path: Path) -> tuple[dict[str, str], list[AliasRule]]:
         if not path.exists():
             return {}, []
 
-        raw = yaml.safe_load(path.read_text()) or {}
+        raw = read_yaml(path) or {}
         defaults = {str(k): str(v) for k, v in (raw.get("defaults") or {}).items()}
 
         alias_rules = []
@@ -47,30 +190,147 @@ class QuestionAnswerer:
         job: JobPosting,
         choices: list[str] | None = None,
     ) -> str:
-        prompt_norm = (prompt or "").strip().lower()
-        choices = [choice.strip() for choice in (choices or []) if choice.strip()]
-
-        key = self._alias_key_for_prompt(prompt_norm)
-        default_answer = self.defaults.get(key, "") if key else ""
-        if not default_answer:
-            default_answer = self._heuristic_default(prompt_norm)
-
+        prompt_norm, choices, default_answer = self._prepare(prompt, choices)
         if choices:
             choice_answer = self._match_choice(default_answer, choices)
             if choice_answer:
                 return choice_answer
 
+        llm_answer = ""
         if self.llm.enabled:
-            llm_answer = self.llm.answer_application_question(
-                prompt=prompt,
+            cache_key = self._answer_cache_key(
+                prompt_norm, input_type, choices, job, default_answer
+            )
+            llm_answer = self._answer_cache.get(cache_key) if cache_key else ""
+            if not llm_answer:
+                reply = self.llm.answer_application_question(
+                    prompt=prompt,
+                    job=job,
+                    default_answer=default_answer,
+                    allowed_choices=choices,
+                    coerce=False,
+                )
+                self._remember_answer(cache_key, reply, choices)
+                llm_answer = coerce_answer(reply, choices, default_answer)
+        return self._finish(prompt_norm, input_type, choices, default_answer, llm_answer)
+
+    def answer_batch(
+        self, questions: list[ApplicationQuestion], job: JobPosting
+    ) -> list[str]:
+        """Answer every question from one form page; results align with `questions`.
+
+        Questions the defaults can't settle go to the LLM together in one request.
+        """
+        answers: list[str | None] = []
+        prepared: list[tuple[str, list[str], str]] = []
+        pending: list[int] = []
+        for index, question in enumerate(questions):
+            prompt_norm, choices, default_answer = self._prepare(question.prompt, question.choices)
+            prepared.append((prompt_norm, choices, default_answer))
+            choice_answer = self._match_choice(default_answer, choices) if choices else ""
+            answers.append(choice_answer or None)
+            if not choice_answer:
+                pending.append(index)
+
+        if not self.llm.enabled:
+            for index in pending:
+                prompt_norm, choices, default_answer = prepared[index]
+                answers[index] = self._finish(
+                    prompt_norm, questions[index].input_type, choices, default_answer, ""
+                )
+            return [answer or "" for answer in answers]
+
+        cache_keys: dict[int, str] = {}
+        uncached: list[int] = []
+        for index in pending:
+            prompt_norm, choices, default_answer = prepared[index]
+            cache_key = self._answer_cache_key(
+                prompt_norm, questions[index].input_type, choices, job, default_answer
+            )
+            cached = self._answer_cache.get(cache_key) if cache_key else ""
+            if cached:
+                answers[index] = self._finish(
+                    prompt_norm, questions[index].input_type, choices, default_answer, cached
+                )
+            else:
+                cache_keys[index] = cache_key
+                uncached.append(index)
+        pending = uncached
+
+        replies = [""] * len(pending)
+        if pending:
+            replies = self.llm.answer_application_questions(
+                [
+                    ApplicationQuestion(
+                        prompt=questions[i].prompt,
+                        input_type=questions[i].input_type,
+                        choices=prepared[i][1],
+                    )
+                    for i in pending
+                ],
                 job=job,
-                default_answer=default_answer,
-                allowed_choices=choices,
+                default_answers=[prepared[i][2] for i in pending],
+                coerce=False,
+            )
+        for index, reply in zip(pending, replies):
+            prompt_norm, choices, default_answer = prepared[index]
+            self._remember_answer(cache_keys[index], reply, choices)
+            llm_answer = coerce_answer(reply, choices, default_answer)
+            answers[index] = self._finish(
+                prompt_norm, questions[index].input_type, choices, default_answer, llm_answer
             )
-            if llm_answer:
-                if choices:
-                    return self._match_choice(llm_answer, choices) or choices[0]
-                return llm_answer[: self.qa_config.max_answer_chars]
+        return [answer or "" for answer in answers]
+
+    def _answer_cache_key(
+        self,
+        prompt_norm: str,
+        input_type: str,
+        choices: list[str],
+        job: JobPosting,
+        default_answer: str,
+    ) -> str:
+        if self._answer_cache is None or not choices:
+            return ""
+        return self._answer_cache.key(
+            prompt_norm, input_type, choices, job.company, default_answer
+        )
+
+    def _remember_answer(self, cache_key: str, reply: str, choices: list[str]) -> None:
+        # Only a raw reply that is exactly one of the choices. Coerced replies
+        # (substring matches, defaults, choices[0]) must not be reused elsewhere.
+        if not cache_key or self._answer_cache is None:
+            return
+        choice = {c.lower(): c for c in choices}.get(reply.strip().lower())
+        if choice:
+            self._answer_cache.put(cache_key, choice)
+
+    def _prepare(self, prompt: str, choices: list[str] | None) -> tuple[str, list[str], str]:
+        prompt_norm = (prompt or "").strip().lower()
+        choices = [choice.strip() for choice in (choices or []) if choice.strip()]
+
+        default_answer = self._known_defaults.get(prompt_norm)
+        if default_answer is None:
+            key = self._alias_key_for_prompt(prompt_norm)
+            default_answer = self.defaults.get(key, "") if key else ""
+            if not default_answer:
+                default_answer = self._heuristic_default(prompt_norm)
+            if len(self._known_defaults) >= _KNOWN_DEFAULTS_MAX:
+                self._known_defaults.clear()
+            self._known_defaults[prompt_norm] = default_answer
+        return prompt_norm, choices, default_answer
+
+    def _finish(
+        self,
+        prompt_norm: str,
+        input_type: str,
+        choices: list[str],
+        default_answer: str,
+        llm_answer: str,
+    ) -> str:
+        if llm_answer:
+            if choices:
+                return self._match_choice(llm_answer, choices) or choices[0]
+            return llm_answer[: self.qa_config.max_answer_chars]
 
         if default_answer:
             if choices:
@@ -92,11 +352,29 @@ class QuestionAnswerer:
             return self.defaults.get("portfolio", "")
         return ""
 
-    def _alias_key_for_prompt(self, prompt: str) -> str:
-        for rule in self.alias_rules:
+    @staticmethod
+    def _build_alias_automaton(alias_rules: list[AliasRule]) -> Any:
+        """One multi-pattern matcher over every alias, when pyahocorasick is installed."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for index, rule in enumerate(alias_rules):
             for pattern in rule.patterns:
-                if pattern and pattern in prompt:
-                    return rule.key
+                # Values carry the rule index so the earliest rule still wins.
+                if pattern and automaton.get(pattern, None) is None:
+                    automaton.add_word(pattern, (index, rule.key))
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _alias_key_for_prompt(self, prompt: str) -> str:
+        if self._alias_automaton is not None:
+            matches = [value for _, value in self._alias_automaton.iter(prompt)]
+            return min(matches)[1] if matches else ""
+        for pattern, key in self._alias_patterns:
+            if pattern in prompt:
+                return key
         return ""
 
     @staticmethod
@@ -6,23 +6,32 @@ import textwrap
 from pathlib import Path
 from string import Template
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
-
 from .llm import LLMClient
 from .models import JobPosting
 from .settings import QAConfig, ResumeConfig
 
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_DASHES_RE = re.compile(r"-{2,}")
+# ASCII letters map to lower case, every other ASCII character to "-".
+_SLUG_TABLE = {
+    i: (chr(i).lower() if chr(i).isascii() and chr(i).isalnum() else "-") for i in range(128)
+}
+# Heading markers and inline markdown characters, stripped in a single pass.
+_MARKDOWN_RE = re.compile(r"^#+\s*|[*_`>-]", re.MULTILINE)
+_WRAPPER = textwrap.TextWrapper(width=95)
+
+
 def _safe_slug(value: str, limit: int = 60) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
+    if value.isascii():
+        cleaned = _DASHES_RE.sub("-", value.translate(_SLUG_TABLE)).strip("-")
+    else:
+        cleaned = _SLUG_RE.sub("-", value).strip("-").lower()
     return cleaned[:limit] or "job"
 
 
 def _markdown_to_plain_text(markdown: str) -> str:
-    text = re.sub(r"^#+\s*", "", markdown, flags=re.MULTILINE)
-    text = re.sub(r"[*_`>-]", "", text)
-    return text.strip()
+    return _MARKDOWN_RE.sub("", markdown).strip()
 
 
 class ResumeBuilder:
@@ -80,29 +89,33 @@ class ResumeBuilder:
 
     @staticmethod
     def _render_pdf(text: str, output_path: Path) -> None:
+        from reportlab.lib.pagesizes import LETTER
+        from reportlab.pdfgen import canvas
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
         c = canvas.Canvas(str(output_path), pagesize=LETTER)
         width, height = LETTER
         margin = 48
-        y = height - margin
         line_height = 14
-
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    y = height - margin
-                continue
-
-            wrapped = textwrap.wrap(line, width=95) or [""]
-            for segment in wrapped:
-                c.drawString(margin, y, segment)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    y = height - margin
+        lines_per_page = int((height - 2 * margin) // line_height) + 1
+
+        # Wrap everything up front; blank source lines keep their vertical gap.
+        segments: list[str] = []
+        for line in [raw_line.strip() for raw_line in text.splitlines()]:
+            if line:
+                segments.extend(_WRAPPER.wrap(line))
+            else:
+                segments.append("")
+
+        for start in range(0, len(segments), lines_per_page):
+            if start:
+                c.showPage()
+            # One text object per page; textLine advances by the leading.
+            text_object = c.beginText(margin, height - margin)
+            text_object.setLeading(line_height)
+            for segment in segments[start : start + lines_per_page]:
+                text_object.textLine(segment)
+            c.drawText(text_object)
 
         c.save()
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import mmap
+import os
+from functools import lru_cache
+
+_TEXT_SUFFIXES: frozenset[str] = frozenset({".txt", ".md"})
+
+
+def read_base_resume_text(path: str) -> str:
+    if os.path.splitext(path)[1].lower() not in _TEXT_SUFFIXES:
+        return ""
+    try:
+        # A single stat both checks existence and supplies the cache key.
+        mtime_ns = os.stat(path).st_mtime_ns
+        return _load_text(os.path.abspath(path), mtime_ns)
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=4)
+def _load_text(path: str, mtime_ns: int) -> str:
+    # mtime_ns is part of the cache key so edits to the file are picked up.
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .llm import LLMClient
+from .models import JobPosting
+from .question_answerer import QuestionAnswerer
+from .resume_text import read_base_resume_text
+from .settings import AutomationConfig, load_config
+
+if TYPE_CHECKING:
+    from .resume_builder import ResumeBuilder
+
+_JOB_FIELDS = tuple(f.name for f in fields(JobPosting))
+
+
+class Services:
+    """Config, LLM client and answerer wired once and reused across jobs."""
+
+    def __init__(self, config: AutomationConfig):
+        self.config = config
+        self.llm = LLMClient(config.llm)
+        self.question_answerer = QuestionAnswerer(config.qa, self.llm)
+        self._resume_builder: ResumeBuilder | None = None
+
+    @property
+    def resume_builder(self) -> ResumeBuilder:
+        # Built on first use so answer-only callers never import reportlab.
+        if self._resume_builder is None:
+            from .resume_builder import ResumeBuilder
+
+            self._resume_builder = ResumeBuilder(self.config.resume, self.config.qa, self.llm)
+        return self._resume_builder
+
+    @property
+    def base_resume_text(self) -> str:
+        return read_base_resume_text(self.config.resume.base_resume_path)
+
+
+@lru_cache(maxsize=1)
+def get_services(config_path: str) -> Services:
+    return Services(load_config(config_path))
+
+
+def job_from_mapping(data: Mapping[str, Any]) -> JobPosting:
+    """Build a JobPosting from CLI args or a JSON record, ignoring unknown keys.
+
+    JobPosting is a plain dataclass, so there is no validation pass here; the
+    only work is picking known fields and str()-ing non-string JSON values.
+    """
+    values = {name: str(data[name]) for name in _JOB_FIELDS if data.get(name) is not None}
+    return JobPosting(**values)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+from . import __version__
+from .jsonio import dumps, loads
 
 DEFAULT_HANDSHAKE_LOGIN_URL = "https://app.joinhandshake.com/login"
 DEFAULT_HANDSHAKE_JOBS_URL = "https://app.joinhandshake.com/stu/postings"
@@ -12,6 +18,7 @@ DEFAULT_HANDSHAKE_JOBS_URL = "https://app.joinhandshake.com/stu/postings"
 DEFAULT_BROWSER_HEADLESS = False
 DEFAULT_BROWSER_SLOW_MO_MS = 120
 DEFAULT_BROWSER_TIMEOUT_MS = 25000
+DEFAULT_BROWSER_BLOCK_HEAVY_RESOURCES = True
 
 DEFAULT_FILTER_SEARCH_QUERY = "software engineer intern"
 DEFAULT_INCLUDE_KEYWORDS = ["software", "engineer", "intern"]
@@ -25,6 +32,8 @@ DEFAULT_APP_AUTO_SUBMIT = False
 DEFAULT_APP_MAX_APPLICATIONS = 25
 DEFAULT_APP_PAUSE_BETWEEN_SEC = 2
 DEFAULT_APP_SAVE_HTML_ON_FAILURE = True
+DEFAULT_APP_PARALLEL_WORKERS = 1
+DEFAULT_APP_ENRICH_CACHE_TTL_HOURS = 24.0
 
 DEFAULT_RESUME_MODE = "markdown_template"
 DEFAULT_RESUME_BASE_PATH = "artifacts/base_resume.txt"
@@ -36,9 +45,18 @@ DEFAULT_LLM_PROVIDER = "openai"
 DEFAULT_LLM_API_KEY_ENV = "OPENAI_API_KEY"
 DEFAULT_LLM_MODEL = "gpt-4o-mini"
 DEFAULT_LLM_TEMPERATURE = 0.2
+DEFAULT_LLM_CACHE_ENABLED = True
+DEFAULT_LLM_CACHE_TTL_HOURS = 72.0
+DEFAULT_LLM_SEMANTIC_CACHE_ENABLED = False
+DEFAULT_LLM_EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_LLM_SEMANTIC_CACHE_THRESHOLD = 0.93
 
 DEFAULT_QA_DEFAULTS_PATH = "config/qa_defaults.yaml"
 DEFAULT_QA_MAX_ANSWER_CHARS = 1000
+DEFAULT_QA_ANSWER_CACHE_PATH = "artifacts/qa_answer_cache.json"
+DEFAULT_QA_ANSWER_CACHE_TTL_HOURS = 720.0
+
+CONFIG_CACHE_DISABLE_ENV = "CLAWDBOT_CFG_NOCACHE"
 
 
 def _as_list(value: Any) -> list[str]:
@@ -62,6 +80,7 @@ class BrowserConfig:
     headless: bool = DEFAULT_BROWSER_HEADLESS
     slow_mo_ms: int = DEFAULT_BROWSER_SLOW_MO_MS
     timeout_ms: int = DEFAULT_BROWSER_TIMEOUT_MS
+    block_heavy_resources: bool = DEFAULT_BROWSER_BLOCK_HEAVY_RESOURCES
 
 
 @dataclass(slots=True)
@@ -85,6 +104,8 @@ class ApplicationConfig:
     max_applications: int = DEFAULT_APP_MAX_APPLICATIONS
     pause_between_apps_sec: int = DEFAULT_APP_PAUSE_BETWEEN_SEC
     save_html_on_failure: bool = DEFAULT_APP_SAVE_HTML_ON_FAILURE
+    parallel_workers: int = DEFAULT_APP_PARALLEL_WORKERS
+    enrich_cache_ttl_hours: float = DEFAULT_APP_ENRICH_CACHE_TTL_HOURS
 
 
 @dataclass(slots=True)
@@ -102,12 +123,19 @@ class LLMConfig:
     api_key_env: str = DEFAULT_LLM_API_KEY_ENV
     model: str = DEFAULT_LLM_MODEL
     temperature: float = DEFAULT_LLM_TEMPERATURE
+    cache_enabled: bool = DEFAULT_LLM_CACHE_ENABLED
+    cache_ttl_hours: float = DEFAULT_LLM_CACHE_TTL_HOURS
+    semantic_cache_enabled: bool = DEFAULT_LLM_SEMANTIC_CACHE_ENABLED
+    embedding_model: str = DEFAULT_LLM_EMBEDDING_MODEL
+    semantic_cache_threshold: float = DEFAULT_LLM_SEMANTIC_CACHE_THRESHOLD
 
 
 @dataclass(slots=True)
 class QAConfig:
     defaults_path: str = DEFAULT_QA_DEFAULTS_PATH
     max_answer_chars: int = DEFAULT_QA_MAX_ANSWER_CHARS
+    answer_cache_path: str = DEFAULT_QA_ANSWER_CACHE_PATH
+    answer_cache_ttl_hours: float = DEFAULT_QA_ANSWER_CACHE_TTL_HOURS
 
 
 @dataclass(slots=True)
@@ -121,12 +149,170 @@ class AutomationConfig:
     qa: QAConfig = field(default_factory=QAConfig)
 
 
+# Part of the cache key so a pickled config is never reused after fields change.
+_CONFIG_SCHEMA = ";".join(
+    f"{cls.__name__}:{','.join(f.name for f in fields(cls))}"
+    for cls in (
+        HandshakeConfig,
+        BrowserConfig,
+        FilterConfig,
+        ApplicationConfig,
+        ResumeConfig,
+        LLMConfig,
+        QAConfig,
+        AutomationConfig,
+    )
+)
+
+
+def _config_cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "clawdbot"
+
+
+def _cache_disabled() -> bool:
+    return os.getenv(CONFIG_CACHE_DISABLE_ENV, "").strip() == "1"
+
+
+def _cache_key(fingerprint: str) -> str:
+    return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+
+
+def _config_cache_path(path: Path) -> Path | None:
+    """Cache file for a config, keyed on its location, mtime, size and package version."""
+    if _cache_disabled():
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    resolved = path.resolve()
+    fingerprint = f"{__version__}:{_CONFIG_SCHEMA}:{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+    return _config_cache_dir() / f"cfg-{_cache_key(str(resolved))}-{_cache_key(fingerprint)}.pkl"
+
+
+def _read_cached_config(cache_path: Path) -> AutomationConfig | None:
+    try:
+        with cache_path.open("rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    return cached if isinstance(cached, AutomationConfig) else None
+
+
+def _write_cached_config(cache_path: Path, config: AutomationConfig) -> None:
+    _write_private_file(cache_path, pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+    _remove_stale_entries(cache_path)
+
+
+def _remove_stale_entries(cache_path: Path) -> None:
+    # Entries are named <kind>-<source path key>-<content key>; once a new one is
+    # written, older entries for the same source file can never be hit again.
+    prefix = cache_path.name.rsplit("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{prefix}-*{cache_path.suffix}"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def _write_private_file(cache_path: Path, data: bytes) -> None:
+    # Cached configs hold credentials, so the cache dir is private and files are
+    # written via a 0600 temp file that is atomically moved into place.
+    tmp_name = ""
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_path.parent, prefix=".cfg-", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(data)
+        os.replace(tmp_name, cache_path)
+    except Exception:
+        if tmp_name:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def read_yaml(path: Path, sidecar: bool = True) -> Any:
+    """Parse a YAML file, reusing the result while its mtime and size are unchanged.
+
+    ``sidecar=False`` skips the on-disk JSON copy, for files cached elsewhere.
+    The returned object is shared between callers and must not be mutated.
+    """
+    stat = path.stat()
+    return _parsed_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size, sidecar)
+
+
+@lru_cache(maxsize=32)
+def _parsed_yaml(path: str, mtime_ns: int, size: int, use_sidecar: bool) -> Any:
+    # A JSON copy of the parsed YAML is much cheaper to load in a fresh process.
+    sidecar = None
+    if use_sidecar and not _cache_disabled():
+        sidecar = (
+            _config_cache_dir()
+            / f"yaml-{_cache_key(path)}-{_cache_key(f'{path}:{mtime_ns}:{size}')}.json"
+        )
+        try:
+            return loads(sidecar.read_text())
+        except Exception:
+            pass
+
+    raw = _load_yaml(Path(path).read_text())
+    if sidecar is not None:
+        try:
+            text = dumps(raw)
+        except (TypeError, ValueError):
+            return raw
+        # Skip YAML that JSON can't represent faithfully (dates, non-string keys).
+        if loads(text) == raw:
+            _write_private_file(sidecar, text.encode())
+            _remove_stale_entries(sidecar)
+    return raw
+
+
+def _load_yaml(text: str) -> Any:
+    # Imported here so sidecar and pickled-config hits never load PyYAML.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
 def load_config(config_path: str | Path) -> AutomationConfig:
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Config not found: {path}")
 
-    raw = yaml.safe_load(path.read_text()) or {}
+    cache_path = _config_cache_path(path)
+    if cache_path is not None:
+        cached = _read_cached_config(cache_path)
+        if cached is not None:
+            return cached
+
+    # The pickle already caches this file; a JSON sidecar would only be a second
+    # plaintext copy of the credentials.
+    config = _build_config(read_yaml(path, sidecar=False) or {})
+    if cache_path is not None:
+        _write_cached_config(cache_path, config)
+    return config
+
+
+# Keyed by the annotation string (annotations are postponed in this module).
+_FIELD_COERCIONS: dict[str, Any] = {
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "list[str]": _as_list,
+}
+
+
+def _instantiate(cls: Any, data: dict[str, Any]) -> Any:
+    """Build a config dataclass from the keys present in ``data``; the rest keep their defaults."""
+    return cls(
+        **{f.name: _FIELD_COERCIONS[f.type](data[f.name]) for f in fields(cls) if f.name in data}
+    )
+
+
+def _build_config(raw: dict[str, Any]) -> AutomationConfig:
     if "handshake" not in raw:
         raise ValueError("Missing required section: handshake")
 
@@ -134,71 +320,12 @@ def load_config(config_path: str | Path) -> AutomationConfig:
     if not hs.get("email") or not hs.get("password"):
         raise ValueError("handshake.email and handshake.password are required")
 
-    browser = raw.get("browser", {}) or {}
-    filters = raw.get("filters", {}) or {}
-    application = raw.get("application", {}) or {}
-    resume = raw.get("resume", {}) or {}
-    llm = raw.get("llm", {}) or {}
-    qa = raw.get("qa", {}) or {}
-
     return AutomationConfig(
-        handshake=HandshakeConfig(
-            email=str(hs["email"]),
-            password=str(hs["password"]),
-            login_url=str(hs.get("login_url", DEFAULT_HANDSHAKE_LOGIN_URL)),
-            jobs_url=str(hs.get("jobs_url", DEFAULT_HANDSHAKE_JOBS_URL)),
-        ),
-        browser=BrowserConfig(
-            headless=bool(browser.get("headless", DEFAULT_BROWSER_HEADLESS)),
-            slow_mo_ms=int(browser.get("slow_mo_ms", DEFAULT_BROWSER_SLOW_MO_MS)),
-            timeout_ms=int(browser.get("timeout_ms", DEFAULT_BROWSER_TIMEOUT_MS)),
-        ),
-        filters=FilterConfig(
-            search_query=str(filters.get("search_query", DEFAULT_FILTER_SEARCH_QUERY)),
-            include_keywords=_as_list(
-                filters.get("include_keywords", DEFAULT_INCLUDE_KEYWORDS)
-            ),
-            exclude_keywords=_as_list(
-                filters.get("exclude_keywords", DEFAULT_EXCLUDE_KEYWORDS)
-            ),
-            preferred_locations=_as_list(
-                filters.get("preferred_locations", DEFAULT_PREFERRED_LOCATIONS)
-            ),
-            remote_only=bool(filters.get("remote_only", DEFAULT_FILTER_REMOTE_ONLY)),
-            max_discovered_jobs=int(
-                filters.get("max_discovered_jobs", DEFAULT_FILTER_MAX_DISCOVERED)
-            ),
-        ),
-        application=ApplicationConfig(
-            dry_run=bool(application.get("dry_run", DEFAULT_APP_DRY_RUN)),
-            auto_submit=bool(application.get("auto_submit", DEFAULT_APP_AUTO_SUBMIT)),
-            max_applications=int(application.get("max_applications", DEFAULT_APP_MAX_APPLICATIONS)),
-            pause_between_apps_sec=int(
-                application.get(
-                    "pause_between_apps_sec", DEFAULT_APP_PAUSE_BETWEEN_SEC
-                )
-            ),
-            save_html_on_failure=bool(
-                application.get(
-                    "save_html_on_failure", DEFAULT_APP_SAVE_HTML_ON_FAILURE
-                )
-            ),
-        ),
-        resume=ResumeConfig(
-            mode=str(resume.get("mode", DEFAULT_RESUME_MODE)),
-            base_resume_path=str(resume.get("base_resume_path", DEFAULT_RESUME_BASE_PATH)),
-            template_path=str(resume.get("template_path", DEFAULT_RESUME_TEMPLATE_PATH)),
-            output_dir=str(resume.get("output_dir", DEFAULT_RESUME_OUTPUT_DIR)),
-        ),
-        llm=LLMConfig(
-            enabled=bool(llm.get("enabled", DEFAULT_LLM_ENABLED)),
-            provider=str(llm.get("provider", DEFAULT_LLM_PROVIDER)),
-            api_key_env=str(llm.get("api_key_env", DEFAULT_LLM_API_KEY_ENV)),
-            model=str(llm.get("model", DEFAULT_LLM_MODEL)),
-            temperature=float(llm.get("temperature", DEFAULT_LLM_TEMPERATURE)),
-        ),
-        qa=QAConfig(
-            defaults_path=str(qa.get("defaults_path", DEFAULT_QA_DEFAULTS_PATH)),
-            max_answer_chars=int(qa.get("max_answer_chars", DEFAULT_QA_MAX_ANSWER_CHARS)),
-        ),
+        handshake=_instantiate(HandshakeConfig, hs),
+        browser=_instantiate(BrowserConfig, raw.get("browser") or {}),
+        filters=_instantiate(FilterConfig, raw.get("filters") or {}),
+        application=_instantiate(ApplicationConfig, raw.get("application") or {}),
+        resume=_instantiate(ResumeConfig, raw.get("resume") or {}),
+        llm=_instantiate(LLMConfig, raw.get("llm") or {}),
+        qa=_instantiate(QAConfig, raw.get("qa") or {}),
     )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class ApplicationBudget:
+    """Thread-safe cap on applications, counting in-flight attempts as used."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.completed = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        with self._lock:
+            return self.completed >= self.limit
+
+    def try_reserve(self) -> bool:
+        with self._lock:
+            if self.completed + self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, succeeded: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if succeeded:
+                self.completed += 1
+
+
+class ApplyPacer:
+    """Spaces applications apart across every worker that shares it.
+
+    Each start reserves the next slot, so parallel workers still send at most
+    one application per interval; the interval also runs from the end of each
+    successful application. The pause runs down while the next job is enriched
+    and filtered, and only the remainder is slept just before it starts.
+    """
+
+    def __init__(
+        self,
+        interval_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._interval_sec = interval_sec
+        self._clock = clock
+        self._sleep = sleep
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval_sec
+        if start > now:
+            self._sleep(start - now)
+
+    def mark_applied(self) -> None:
+        with self._lock:
+            self._next_start = max(self._next_start, self._clock() + self._interval_sec)
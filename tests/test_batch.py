@@ -0,0 +1,37 @@
+import io
+import json
+from pathlib import Path
+
+from clawdbot_internship_automation.batch import run
+from clawdbot_internship_automation.services import Services
+from clawdbot_internship_automation.settings import (
+    AutomationConfig,
+    HandshakeConfig,
+    LLMConfig,
+    QAConfig,
+)
+
+
+def test_batch_answers_each_job(tmp_path: Path) -> None:
+    defaults_file = tmp_path / "qa_defaults.yaml"
+    defaults_file.write_text('defaults:\n  gpa: "3.9"\nprompt_aliases:\n  - key: gpa\n    patterns: [gpa]\n')
+    services = Services(
+        AutomationConfig(
+            handshake=HandshakeConfig(email="a@example.com", password="x"),
+            llm=LLMConfig(enabled=False),
+            qa=QAConfig(defaults_path=str(defaults_file)),
+        )
+    )
+    lines = [
+        json.dumps({"job_id": "1", "title": "SWE Intern", "questions": [{"prompt": "GPA"}]}),
+        "",
+        json.dumps({"title": "missing id"}),
+    ]
+    out = io.StringIO()
+
+    failures = run(lines, out, services, build_resume=False)
+
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert failures == 1
+    assert results[0]["answers"][0]["answer"] == "3.9"
+    assert "error" in results[1]
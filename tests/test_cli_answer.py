@@ -0,0 +1,29 @@
+import pytest
+
+from clawdbot_internship_automation.cli_answer import _build_parser, _fast_parse, _parse_choices
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--prompt", "GPA?"],
+        ["--prompt=GPA?", "--choices", "A|B", "--json", "--company", "Acme"],
+        ["--config", "c.yaml", "--prompt", "x", "--no-daemon", "--prompt", "y"],
+    ],
+)
+def test_fast_parse_matches_argparse(argv: list[str]) -> None:
+    assert vars(_fast_parse(argv)) == vars(_build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [[], ["-h"], ["--prom", "x"], ["--prompt"], ["--prompt", "-x"], ["--json=1", "--prompt", "x"]],
+)
+def test_fast_parse_defers_unusual_argv(argv: list[str]) -> None:
+    assert _fast_parse(argv) is None
+
+
+def test_parse_choices() -> None:
+    assert _parse_choices('["Yes", " No ", ""]') == ["Yes", "No"]
+    assert _parse_choices("[1, 2]") == ["1", "2"]
+    assert _parse_choices("A | B ||") == ["A", "B"]
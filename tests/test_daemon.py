@@ -0,0 +1,83 @@
+import os
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from clawdbot_internship_automation import daemon, daemon_client
+
+
+def test_daemon_answers_and_falls_back(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLAWDBOT_CFG_NOCACHE", "1")
+    (tmp_path / "qa.yaml").write_text(
+        'defaults: {gpa: "3.9"}\nprompt_aliases: [{key: gpa, patterns: [gpa]}]\n'
+    )
+    config = tmp_path / "application.yaml"
+    config.write_text(
+        'handshake: {email: a@example.com, password: x}\n'
+        "llm: {enabled: false}\n"
+        "qa: {defaults_path: qa.yaml}\n"
+    )
+    sock = tmp_path / "d.sock"
+    payload = {
+        "op": "answer",
+        "config": str(config),
+        "prompt": "GPA",
+        "job": {"job_id": "1", "title": "t"},
+    }
+
+    assert daemon.request(payload, sock) is None
+
+    server = daemon._DaemonServer(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert daemon.request(payload, sock) == {"answer": "3.9"}
+        assert daemon.request({**payload, "op": "unknown"}, sock) is None
+
+        qa_path = tmp_path / "qa.yaml"
+        qa_path.write_text(
+            'defaults: {gpa: "4.0"}\nprompt_aliases: [{key: gpa, patterns: [gpa]}]\n'
+        )
+        stamp = qa_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(qa_path, ns=(stamp, stamp))
+        assert daemon.request(payload, sock) == {"answer": "4.0"}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_request_skips_socket_in_shared_directory(tmp_path: Path) -> None:
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    sock = shared / "d.sock"
+    server = daemon._DaemonServer(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert daemon.request({"op": "ping"}, sock) is None
+        shared.chmod(0o700)
+        assert daemon.request({"op": "ping"}, sock) == {}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_request_falls_back_only_before_sending(tmp_path: Path, monkeypatch) -> None:
+    sock_path = tmp_path / "d.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(sock_path))
+    # Bound but not listening: connect is refused, so the caller runs inline.
+    assert daemon.request({"op": "ping"}, sock_path) is None
+
+    # Accepts the request but never replies, like a daemon still generating.
+    listener.listen(1)
+    monkeypatch.setattr(daemon_client, "CLIENT_TIMEOUT_SEC", 0.2)
+    try:
+        with pytest.raises(daemon_client.DaemonError):
+            daemon.request({"op": "ping"}, sock_path)
+    finally:
+        listener.close()
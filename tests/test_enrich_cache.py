@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from clawdbot_internship_automation.enrich_cache import EnrichCache
+from clawdbot_internship_automation.models import JobPosting
+
+
+def test_enrich_cache_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "enrich_cache.json"
+    job = JobPosting(job_id="7", title="SWE Intern", company="Acme", url="https://x/jobs/7")
+
+    cache = EnrichCache(path, ttl_sec=3600)
+    assert cache.get(job.url) is None
+    cache.put(job)
+    cache.save()
+
+    assert EnrichCache(path, ttl_sec=3600).get(job.url) == job
+
+
+def test_enrich_cache_expires_and_disables(tmp_path: Path) -> None:
+    path = tmp_path / "enrich_cache.json"
+    job = JobPosting(job_id="7", title="SWE Intern", url="https://x/jobs/7")
+    cache = EnrichCache(path, ttl_sec=3600)
+    cache.put(job)
+    cache.save()
+
+    assert EnrichCache(path, ttl_sec=1e-9).get(job.url) is None
+    disabled = EnrichCache(path, ttl_sec=0)
+    assert disabled.get(job.url) is None
@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["cli", "cli_answer", "cli_resume", "llm", "resume_builder"])
+def test_cli_import_skips_heavy_dependencies(module: str) -> None:
+    code = (
+        f"import sys, clawdbot_internship_automation.{module}; "
+        "print(','.join(m for m in ('playwright', 'reportlab', 'openai', 'yaml', 'socketserver', 'asyncio') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert out == ""
@@ -0,0 +1,68 @@
+import pytest
+
+from clawdbot_internship_automation.job_filters import JobFilter, keyword_pattern
+from clawdbot_internship_automation.models import JobPosting
+from clawdbot_internship_automation.settings import FilterConfig
+
+
+def _substring_match(keywords: list[str], text: str) -> bool:
+    """The per-keyword `in` check the compiled patterns replaced."""
+    return any(kw.lower() in text for kw in keywords if kw.strip())
+
+
+_TEXTS = [
+    "software engineering internship\nacme\nnew york, ny\nc++ and c# required",
+    "senior staff engineer (10+ years)\nbig co\nremote\n$150k. full-time",
+    "data science intern\n\nsan francisco\nuses a*b testing [daily]",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        ["intern", "Internship"],
+        ["C++", "c#", "(10+ years)", "$150K.", "a*b", "[daily]"],
+        ["new york", "  ", "SAN FRANCISCO"],
+        ["engineer", "engineering", "eng"],
+        ["  remote "],
+        ["nothing here"],
+    ],
+)
+@pytest.mark.parametrize("text", _TEXTS)
+def test_keyword_pattern_matches_like_substring_checks(keywords: list[str], text: str) -> None:
+    pattern = keyword_pattern(keywords)
+    assert pattern is not None
+    assert bool(pattern.search(text)) == _substring_match(keywords, text)
+
+
+@pytest.mark.parametrize("keywords", [[], ["", "   "]])
+def test_keyword_pattern_is_none_without_keywords(keywords: list[str]) -> None:
+    assert keyword_pattern(keywords) is None
+
+
+def _job(**fields: str) -> JobPosting:
+    return JobPosting(job_id="1", **{"title": "Software Engineering Intern", **fields})
+
+
+def test_job_filter_applies_each_list() -> None:
+    job_filter = JobFilter(
+        FilterConfig(
+            include_keywords=["intern"],
+            exclude_keywords=["senior", "c++"],
+            preferred_locations=["New York"],
+        )
+    )
+    assert job_filter.matches(_job(location="New York, NY"))
+    assert not job_filter.matches(_job(location="Boston, MA"))
+    assert not job_filter.matches(_job(location="New York", description="Modern C++"))
+    assert not job_filter.matches(_job(title="Software Engineer", location="New York"))
+
+
+def test_job_filter_with_empty_lists_only_checks_remote() -> None:
+    config = FilterConfig(include_keywords=[], exclude_keywords=[], preferred_locations=[])
+    assert JobFilter(config).matches(_job())
+
+    config.remote_only = True
+    assert not JobFilter(config).matches(_job(location="Boston"))
+    assert JobFilter(config).matches(_job(location="Remote"))
@@ -0,0 +1,51 @@
+from clawdbot_internship_automation.job_page_parser import parse_job_page
+
+
+def test_parse_job_page_extracts_fields() -> None:
+    html = """
+    <html><head><script>var x = "<h1>no</h1>";</script></head>
+    <body><main>
+      <h1>Software Engineer <span>Intern</span></h1>
+      <a href="/employers/42">Acme   Corp</a>
+      <div data-qa="job-location">Remote<br>US</div>
+      <p>Build things.</p>
+    </main></body></html>
+    """
+    fields = parse_job_page(html)
+    assert fields["title"] == "Software Engineer Intern"
+    assert fields["company"] == "Acme Corp"
+    assert fields["location"] == "Remote US"
+    assert "Build things." in fields["description"]
+
+
+def test_parse_job_page_skips_empty_matches() -> None:
+    html = '<h1></h1><div data-testid="employer-name"> </div><h1>Real</h1><article>Body</article>'
+    assert parse_job_page(html) == {"title": "Real", "description": "Body"}
+
+
+def test_parse_job_page_prefers_earlier_matcher_over_dom_order() -> None:
+    html = """
+    <div data-qa="employer-name">Listed By Co</div>
+    <div data-qa="job-location">Boston, MA</div>
+    <a href="https://app.joinhandshake.com/employers/7">Acme</a>
+    <span data-testid="location">Remote</span>
+    <article>Teaser</article>
+    <main>Full description</main>
+    """
+    fields = parse_job_page(html)
+    assert fields["company"] == "Acme"
+    assert fields["location"] == "Remote"
+    assert fields["description"] == "Full description"
+
+
+def test_parse_job_page_matches_data_attributes_exactly() -> None:
+    html = """
+    <h1>Intern</h1>
+    <div data-testid="location-map">Map widget</div>
+    <div data-testid="employer-name-logo">Logo alt</div>
+    <div data-qa="employer-name">Acme</div>
+    <div data-qa="job-location">New York</div>
+    """
+    fields = parse_job_page(html)
+    assert fields["company"] == "Acme"
+    assert fields["location"] == "New York"
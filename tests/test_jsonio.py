@@ -0,0 +1,27 @@
+import io
+
+from clawdbot_internship_automation import jsonio
+
+
+def test_write_json_output_matches_without_orjson(capsysbinary, monkeypatch) -> None:
+    payload = {"answer": "Café — yes", "n": [1, 2]}
+    jsonio.write_json(payload)
+    with_default = capsysbinary.readouterr().out
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+    jsonio.write_json(payload)
+    assert capsysbinary.readouterr().out == with_default == (
+        '{"answer":"Café — yes","n":[1,2]}\n'.encode()
+    )
+
+
+def test_write_json_keeps_earlier_text_first(monkeypatch) -> None:
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+    monkeypatch.setattr("sys.stdout", stdout)
+    stdout.write("note\n")
+    jsonio.write_json({"a": 1})
+    jsonio.write_json({"a": 2})
+    stdout.write("done\n")
+    stdout.flush()
+    assert raw.getvalue() == b'note\n{"a":1}\n{"a":2}\ndone\n'
@@ -0,0 +1,67 @@
+import json
+import logging
+from types import SimpleNamespace
+
+from clawdbot_internship_automation.llm import LLMClient
+from clawdbot_internship_automation.models import JobPosting
+from clawdbot_internship_automation.settings import LLMConfig
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+class _NoStructuredOutputs:
+    """Chat completions stub for a backend that only knows json_object."""
+
+    def __init__(self) -> None:
+        self.formats: list[object] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        response_format = kwargs.get("response_format")
+        self.formats.append(response_format and response_format["type"])
+        if response_format and response_format["type"] == "json_schema":
+            raise _BadRequest("response_format json_schema is not supported")
+        content = "```json\n" + json.dumps({"summary": "Tailored", "top_skills": ["Go"]}) + "\n```"
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_resume_sections_fall_back_to_json_mode(caplog) -> None:
+    client = LLMClient(LLMConfig(enabled=False, cache_enabled=False))
+    backend = _NoStructuredOutputs()
+    client._client = backend
+    job = JobPosting(job_id="1", title="SWE Intern")
+
+    with caplog.at_level(logging.WARNING):
+        sections = client.generate_resume_sections(job, "resume")
+    assert sections["summary"] == "Tailored"
+    assert sections["top_skills"] == ["Go"]
+    assert "rejected response_format json_schema" in caplog.text
+
+    client.generate_resume_sections(job, "resume")
+    assert backend.formats == ["json_schema", "json_object", "json_object"]
+
+
+def test_exact_cache_hit_skips_embedding(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    client = LLMClient(LLMConfig(enabled=False, semantic_cache_enabled=True))
+    backend = _NoStructuredOutputs()
+    embedded: list[str] = []
+
+    def _embed(**kwargs):
+        embedded.append(kwargs["input"])
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.0])])
+
+    backend.embeddings = SimpleNamespace(create=_embed)
+    client._client = backend
+    job = JobPosting(job_id="1", title="SWE Intern", description="Build things")
+
+    first = client.generate_resume_sections(job, "resume")
+    assert client.generate_resume_sections(job, "resume") == first
+    assert len(embedded) == 1
+    # Same posting, different resume: the semantic entry is out of scope.
+    client.generate_resume_sections(job, "other resume")
+    assert len(embedded) == 2
+    assert backend.formats == ["json_schema", "json_object", "json_object"]
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from clawdbot_internship_automation.llm_cache import LLMResponseCache, SemanticCache
+
+
+def test_llm_cache_round_trip_and_expiry(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path, ttl_sec=3600)
+    key = cache.key("gpt-4o-mini", 0.2, "system", "user")
+    assert key != cache.key("gpt-4o-mini", 0.2, "system", "other user")
+    assert key != cache.key("gpt-4o-mini", 0.2, "system", "user", {"type": "json_object"})
+    assert cache.get(key) is None
+
+    cache.put(key, "cached reply")
+    assert cache.get(key) == "cached reply"
+    assert LLMResponseCache(tmp_path, ttl_sec=1e-9).get(key) is None
+
+
+def test_semantic_cache_matches_close_embeddings(tmp_path: Path) -> None:
+    path = tmp_path / "sections.jsonl"
+    cache = SemanticCache(path, threshold=0.93, ttl_sec=3600)
+    scope = SemanticCache.scope("gpt-4o-mini", "resume")
+    assert cache.lookup([1.0, 0.0, 0.0], scope) is None
+
+    cache.add([1.0, 0.0, 0.0], {"summary": "stored"}, scope)
+    assert cache.lookup([0.99, 0.05, 0.0], scope) == {"summary": "stored"}
+    assert cache.lookup([0.0, 1.0, 0.0], scope) is None
+    reloaded = SemanticCache(path, threshold=0.93, ttl_sec=3600)
+    assert reloaded.lookup([2.0, 0.0, 0.0], scope) == {"summary": "stored"}
+
+
+def test_semantic_cache_respects_scope_and_ttl(tmp_path: Path) -> None:
+    path = tmp_path / "sections.jsonl"
+    cache = SemanticCache(path, threshold=0.93, ttl_sec=3600)
+    cache.add([1.0, 0.0], {"summary": "stored"}, SemanticCache.scope("gpt-4o-mini", "resume"))
+    assert cache.lookup([1.0, 0.0], SemanticCache.scope("gpt-4o-mini", "new resume")) is None
+    assert cache.lookup([1.0, 0.0], SemanticCache.scope("gpt-4o", "resume")) is None
+    expired = SemanticCache(path, threshold=0.93, ttl_sec=1e-9)
+    assert expired.lookup([1.0, 0.0], SemanticCache.scope("gpt-4o-mini", "resume")) is None
@@ -1,7 +1,8 @@
+import time
 from pathlib import Path
 
-from clawdbot_internship_automation.models import JobPosting
-from clawdbot_internship_automation.question_answerer import QuestionAnswerer
+from clawdbot_internship_automation.models import ApplicationQuestion, JobPosting
+from clawdbot_internship_automation.question_answerer import QuestionAnswerer, _AnswerCache
 from clawdbot_internship_automation.settings import QAConfig
 
 
@@ -31,3 +32,166 @@ prompt_aliases:
     job = JobPosting(job_id="1", title="SWE Intern")
     answer = qa.answer("Are you legally authorized to work in the US?", "radio", job, ["Yes", "No"])
     assert answer == "Yes"
+
+
+def test_prompt_defaults_resolved_once(tmp_path: Path, monkeypatch) -> None:
+    qa = QuestionAnswerer(
+        qa_config=QAConfig(defaults_path=str(tmp_path / "missing.yaml")),
+        llm=_NoLLM(),  # type: ignore[arg-type]
+    )
+    job = JobPosting(job_id="1", title="SWE Intern")
+    assert qa.answer("Willing to relocate?", "radio", job, ["No", "Yes"]) == "Yes"
+
+    def _fail(prompt: str) -> str:
+        raise AssertionError("alias rules rescanned for a known prompt")
+
+    monkeypatch.setattr(qa, "_alias_key_for_prompt", _fail)
+    assert qa.answer("  Willing to relocate? ", "radio", job, ["No", "Yes"]) == "Yes"
+
+
+def test_answer_batch_keeps_question_order(tmp_path: Path) -> None:
+    qa = QuestionAnswerer(
+        qa_config=QAConfig(defaults_path=str(tmp_path / "missing.yaml")),
+        llm=_NoLLM(),  # type: ignore[arg-type]
+    )
+    job = JobPosting(job_id="1", title="SWE Intern")
+    answers = qa.answer_batch(
+        [
+            ApplicationQuestion(
+                prompt="Will you require visa sponsorship?",
+                input_type="radio",
+                choices=["Yes", "No"],
+            ),
+            ApplicationQuestion(prompt="Favourite colour", input_type="text"),
+            ApplicationQuestion(prompt="Pick one", input_type="select", choices=["A", "B"]),
+        ],
+        job,
+    )
+    assert answers == ["No", "", "A"]
+
+
+class _BatchLLM:
+    enabled = True
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def answer_application_questions(self, questions, job, default_answers, coerce=True):
+        self.calls.append([question.prompt for question in questions])
+        return [f"llm:{question.prompt}" for question in questions]
+
+
+def test_answer_batch_sends_unsettled_questions_in_one_llm_call(tmp_path: Path) -> None:
+    llm = _BatchLLM()
+    qa = QuestionAnswerer(
+        qa_config=QAConfig(defaults_path=str(tmp_path / "missing.yaml")),
+        llm=llm,  # type: ignore[arg-type]
+    )
+    job = JobPosting(job_id="1", title="SWE Intern")
+    answers = qa.answer_batch(
+        [
+            ApplicationQuestion(prompt="Why us?", input_type="textarea"),
+            ApplicationQuestion(
+                prompt="Need visa sponsorship?", input_type="radio", choices=["Yes", "No"]
+            ),
+            ApplicationQuestion(prompt="Favourite tool?", input_type="text"),
+        ],
+        job,
+    )
+    assert llm.calls == [["Why us?", "Favourite tool?"]]
+    assert answers == ["llm:Why us?", "No", "llm:Favourite tool?"]
+
+
+def test_reworded_choice_question_reuses_cached_llm_answer(tmp_path: Path) -> None:
+    class _ChoiceLLM(_BatchLLM):
+        def answer_application_questions(self, questions, job, default_answers, coerce=True):
+            self.calls.append([question.prompt for question in questions])
+            return ["Hybrid" for _ in questions]
+
+    llm = _ChoiceLLM()
+    qa = QuestionAnswerer(
+        qa_config=QAConfig(
+            defaults_path=str(tmp_path / "missing.yaml"),
+            answer_cache_path=str(tmp_path / "answers.json"),
+        ),
+        llm=llm,  # type: ignore[arg-type]
+    )
+    choices = ["Remote", "Hybrid", "Onsite"]
+    first = qa.answer_batch(
+        [
+            ApplicationQuestion(
+                prompt="Preferred work setting at Acme?", input_type="radio", choices=choices
+            )
+        ],
+        JobPosting(job_id="1", title="SWE Intern", company="Acme"),
+    )
+    second = qa.answer_batch(
+        [
+            ApplicationQuestion(
+                prompt="Your preferred work setting at Globex", input_type="radio", choices=choices
+            )
+        ],
+        JobPosting(job_id="2", title="SWE Intern", company="Globex"),
+    )
+    assert first == second == ["Hybrid"]
+    assert len(llm.calls) == 1
+
+
+def test_coerced_llm_reply_is_not_cached(tmp_path: Path) -> None:
+    class _VagueLLM(_BatchLLM):
+        def answer_application_questions(self, questions, job, default_answers, coerce=True):
+            self.calls.append([question.prompt for question in questions])
+            return ["Unclear." for _ in questions]
+
+    llm = _VagueLLM()
+    cache_path = tmp_path / "answers.json"
+    qa = QuestionAnswerer(
+        qa_config=QAConfig(
+            defaults_path=str(tmp_path / "missing.yaml"),
+            answer_cache_path=str(cache_path),
+        ),
+        llm=llm,  # type: ignore[arg-type]
+    )
+    question = ApplicationQuestion(
+        prompt="Will you need an employer to file a petition for you?",
+        input_type="radio",
+        choices=["Yes", "No"],
+    )
+    job = JobPosting(job_id="1", title="SWE Intern", company="Acme")
+    assert qa.answer_batch([question], job) == ["Yes"]
+    assert qa.answer_batch([question], job) == ["Yes"]
+    assert len(llm.calls) == 2
+    assert not cache_path.exists()
+
+
+def _cache_key(prompt: str, default_answer: str = "") -> str:
+    return _AnswerCache.key(prompt, "radio", ["Yes", "No"], "Acme", default_answer)
+
+
+def test_answer_cache_key_keeps_country_and_default() -> None:
+    assert _cache_key("are you a u.s. citizen?") != _cache_key("are you a citizen?")
+    assert _cache_key("are you authorized to work in the united states?") != _cache_key(
+        "are you authorized to work?"
+    )
+    assert _cache_key("relocate?", default_answer="Yes") != _cache_key(
+        "relocate?", default_answer="No"
+    )
+
+
+def test_answer_cache_entries_expire(tmp_path: Path, monkeypatch) -> None:
+    cache = _AnswerCache(tmp_path / "answers.json", ttl_sec=60)
+    cache.put("k", "Yes")
+    assert cache.get("k") == "Yes"
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("k") == ""
+
+
+def test_answer_cache_merges_writes_from_other_processes(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    cli, daemon = _AnswerCache(path, ttl_sec=60), _AnswerCache(path, ttl_sec=60)
+    assert cli.get("a") == daemon.get("b") == ""
+    cli.put("a", "Yes")
+    daemon.put("b", "No")
+    assert cli.get("b") == "No"
+    assert _AnswerCache(path, ttl_sec=60).get("a") == "Yes"
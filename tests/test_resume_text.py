@@ -0,0 +1,25 @@
+import os
+from pathlib import Path
+
+from clawdbot_internship_automation.resume_text import read_base_resume_text
+
+
+def test_read_base_resume_text(tmp_path: Path) -> None:
+    resume = tmp_path / "base_resume.txt"
+    resume.write_text("Python, SQL")
+    assert read_base_resume_text(str(resume)) == "Python, SQL"
+
+    resume.write_text("Python, SQL, Go")
+    stat = resume.stat()
+    os.utime(resume, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_base_resume_text(str(resume)) == "Python, SQL, Go"
+
+
+def test_read_base_resume_text_ignores_missing_and_binary(tmp_path: Path) -> None:
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    assert read_base_resume_text(str(pdf)) == ""
+    assert read_base_resume_text(str(tmp_path / "missing.txt")) == ""
+    empty = tmp_path / "empty.md"
+    empty.write_text("")
+    assert read_base_resume_text(str(empty)) == ""
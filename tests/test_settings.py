@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import yaml
+
+from clawdbot_internship_automation import settings
 from clawdbot_internship_automation.settings import load_config
 
 
@@ -20,3 +23,85 @@ application:
     assert config.application.dry_run is True
     assert config.application.max_applications == 7
 
+
+def test_load_config_coerces_values_and_keeps_defaults(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv(settings.CONFIG_CACHE_DISABLE_ENV, "1")
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text(
+        'handshake: {email: a@example.com, password: x}\n'
+        'browser: {timeout_ms: "5000"}\n'
+        "filters: {include_keywords: backend, unknown_key: 1}\n"
+    )
+    config = load_config(config_file)
+    assert config.browser.timeout_ms == 5000
+    assert config.browser.slow_mo_ms == settings.DEFAULT_BROWSER_SLOW_MO_MS
+    assert config.filters.include_keywords == ["backend"]
+    assert config.filters.exclude_keywords == []
+
+
+def test_load_config_uses_cache(tmp_path: Path) -> None:
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text(
+        """
+handshake:
+  email: "test@example.com"
+  password: "secret"
+        """.strip()
+    )
+    first = load_config(config_file)
+    assert list(settings._config_cache_dir().glob("cfg-*.pkl"))
+
+    second = load_config(config_file)
+    assert second == first
+    assert second is not first
+
+
+def test_cached_config_skips_parsing(tmp_path: Path, monkeypatch) -> None:
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text('handshake: {email: "a@example.com", password: "x"}')
+    load_config(config_file)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("config was re-parsed on a cache hit")
+
+    monkeypatch.setattr(settings, "_build_config", _fail)
+    monkeypatch.setattr(yaml, "load", _fail)
+    assert load_config(config_file).handshake.email == "a@example.com"
+
+
+def test_config_cache_replaces_stale_entry_without_sidecar(tmp_path: Path) -> None:
+    cache_dir = settings._config_cache_dir()
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text('handshake: {email: "a@example.com", password: "x"}')
+    load_config(config_file)
+    first = list(cache_dir.glob("cfg-*.pkl"))
+
+    config_file.write_text('handshake: {email: "b@example.com", password: "x"}')
+    assert load_config(config_file).handshake.email == "b@example.com"
+    second = list(cache_dir.glob("cfg-*.pkl"))
+    assert len(first) == len(second) == 1 and first != second
+    assert not list(cache_dir.glob("yaml-*.json"))
+
+
+def test_read_yaml_reparses_only_on_change(tmp_path: Path) -> None:
+    path = tmp_path / "qa.yaml"
+    path.write_text("a: 1\n")
+    first = settings.read_yaml(path)
+    assert settings.read_yaml(path) is first
+
+    path.write_text("a: 22\n")
+    assert settings.read_yaml(path) == {"a": 22}
+
+
+def test_yaml_sidecar_skips_yaml_parser(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "qa.yaml"
+    path.write_text("defaults: {email: a@example.com}\n")
+    settings.read_yaml(path)
+    assert list(settings._config_cache_dir().glob("yaml-*.json"))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("YAML was re-parsed despite a JSON sidecar")
+
+    settings._parsed_yaml.cache_clear()
+    monkeypatch.setattr(yaml, "load", _fail)
+    assert settings.read_yaml(path) == {"defaults": {"email": "a@example.com"}}
@@ -0,0 +1,85 @@
+import threading
+
+from clawdbot_internship_automation.throttle import ApplicationBudget, ApplyPacer
+
+
+def test_budget_counts_in_flight_attempts() -> None:
+    budget = ApplicationBudget(2)
+    assert budget.try_reserve()
+    assert budget.try_reserve()
+    assert not budget.try_reserve()
+
+    budget.release(succeeded=False)
+    assert not budget.exhausted
+    assert budget.try_reserve()
+    budget.release(succeeded=True)
+    budget.release(succeeded=True)
+    assert budget.exhausted
+    assert budget.completed == 2
+    assert not budget.try_reserve()
+
+
+def test_budget_cap_holds_under_concurrency() -> None:
+    budget = ApplicationBudget(5)
+    start = threading.Barrier(16)
+    granted: list[bool] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        start.wait()
+        for _ in range(50):
+            if budget.try_reserve():
+                with lock:
+                    granted.append(True)
+                budget.release(succeeded=True)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(granted) == budget.completed == 5
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_pacer_sleeps_only_the_remaining_pause() -> None:
+    clock = _FakeClock()
+    pacer = ApplyPacer(5, clock=clock, sleep=clock.sleep)
+    pacer.wait()
+    assert clock.sleeps == []
+
+    clock.now += 10  # the application itself
+    pacer.mark_applied()
+    clock.now += 3  # enriching and filtering the next job
+    pacer.wait()
+    assert clock.sleeps == [2]
+
+
+def test_pacer_skips_pause_after_last_application() -> None:
+    clock = _FakeClock()
+    pacer = ApplyPacer(5, clock=clock, sleep=clock.sleep)
+    pacer.wait()
+    pacer.mark_applied()
+    # No further wait() means nothing is slept once the run ends.
+    assert clock.sleeps == []
+
+
+def test_pacer_spaces_concurrent_starts() -> None:
+    clock = _FakeClock()
+    pacer = ApplyPacer(5, clock=clock, sleep=lambda seconds: clock.sleeps.append(seconds))
+    pacer.wait()
+    pacer.wait()
+    pacer.wait()
+    assert clock.sleeps == [5, 10]